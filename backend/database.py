@@ -1,12 +1,82 @@
 import os
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+import zlib
+import asyncio
+from typing import Dict, List
+from bson import Binary
+from pymongo import AsyncMongoClient, WriteConcern
+from pymongo.asynchronous.database import AsyncDatabase
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Global database client
-client: AsyncIOMotorClient = None
-database: AsyncIOMotorDatabase = None
+client: AsyncMongoClient = None
+database: AsyncDatabase = None
+
+class AnalysisWriter:
+    """Buffer analysis documents and write them with batched insert_many"""
+    
+    def __init__(self, max_batch_size: int = 100, flush_interval: float = 0.5):
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: asyncio.Task = None
+    
+    async def enqueue(self, document: Dict):
+        """Queue a document for the next batch write"""
+        self.queue.put_nowait(document)
+    
+    async def run(self):
+        """Drain up to max_batch_size documents or flush_interval seconds per batch"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        while not stopping:
+            document = await self.queue.get()
+            if document is None:
+                break
+            
+            batch = [document]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    document = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if document is None:
+                    stopping = True
+                    break
+                batch.append(document)
+            
+            await self.write_batch(batch)
+    
+    async def write_batch(self, batch: List[Dict]):
+        """Insert a batch of documents, logging rather than raising on failure"""
+        try:
+            collection = database.analyses.with_options(write_concern=WriteConcern(w=1))
+            await collection.insert_many(batch, ordered=False)
+            logger.info(f"Saved {len(batch)} analyses to database")
+        except Exception as e:
+            logger.error(f"Database batch save error: {str(e)}")
+    
+    def start(self):
+        """Start the background flush task"""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        """Flush queued documents and stop the background task"""
+        if self.task is None:
+            return
+        self.queue.put_nowait(None)
+        await self.task
+        self.task = None
+
+# Global batched writer for analysis documents
+analysis_writer = AnalysisWriter()
 
 async def connect_to_mongo():
     """Create database connection"""
@@ -17,7 +87,8 @@ async def connect_to_mongo():
         if not mongo_url:
             raise ValueError("MONGO_URL environment variable not set")
         
-        client = AsyncIOMotorClient(mongo_url)
+        client = AsyncMongoClient(mongo_url)
+        await client.aconnect()
         
         # Test connection
         await client.admin.command('ping')
@@ -27,9 +98,13 @@ async def connect_to_mongo():
         db_name = os.environ.get('DB_NAME', 'resume_ats')
         database = client[db_name]
         
-        # Create indexes for better performance
+        # Create collections and indexes for better performance
+        await create_collections()
         await create_indexes()
         
+        # Start batched writer for analysis documents
+        analysis_writer.start()
+        
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {str(e)}")
         raise
@@ -38,23 +113,50 @@ async def close_mongo_connection():
     """Close database connection"""
     global client
     if client:
-        client.close()
+        await analysis_writer.stop()
+        await client.close()
         logger.info("Disconnected from MongoDB")
 
+async def create_collections():
+    """Create collections with zstd block compression if they don't exist yet"""
+    try:
+        if "analyses" not in await database.list_collection_names():
+            await database.create_collection(
+                "analyses",
+                storageEngine={"wiredTiger": {"configString": "block_compressor=zstd"}}
+            )
+            logger.info("Created analyses collection with zstd block compression")
+        
+    except Exception as e:
+        logger.warning(f"Could not create collections: {str(e)}")
+
 async def create_indexes():
     """Create database indexes for better performance"""
     try:
-        # Index on upload_date for sorting
-        await database.analyses.create_index([("upload_date", -1)])
+        # Drop indexes that no query uses or that the compound index below covers
+        existing_indexes = [index["name"] async for index in await database.analyses.list_indexes()]
+        for index_name in ("file_name_1", "upload_date_-1", "content_hash_1"):
+            if index_name in existing_indexes:
+                await database.analyses.drop_index(index_name)
         
-        # Index on file_name for searching
-        await database.analyses.create_index("file_name")
+        # Compound index covering the history sort and pagination
+        await database.analyses.create_index([("upload_date", -1), ("_id", 1)])
         
         logger.info("Database indexes created successfully")
         
     except Exception as e:
         logger.warning(f"Could not create indexes: {str(e)}")
 
-def get_database() -> AsyncIOMotorDatabase:
+def compress_text(text: str) -> Binary:
+    """Compress text for storage"""
+    return Binary(zlib.compress(text.encode('utf-8')))
+
+def decompress_text(value) -> str:
+    """Decompress stored text (documents written before compression hold plain strings)"""
+    if isinstance(value, str):
+        return value
+    return zlib.decompress(value).decode('utf-8')
+
+def get_database() -> AsyncDatabase:
     """Dependency to get database instance"""
     return database
\ No newline at end of file
@@ -1,15 +1,19 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
 class Keyword(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     keyword: str
     importance: str = Field(..., description="high, medium, or low")
     frequency: int
     present: Optional[bool] = None
 
 class Issue(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(..., description="critical, warning, or info")
     category: str
     title: str
@@ -17,11 +21,15 @@ class Issue(BaseModel):
     suggestions: List[str] = []
 
 class SectionAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     present: bool
     score: int = Field(..., ge=0, le=100)
     issues: List[str] = []
 
 class Recommendation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     priority: str = Field(..., description="high, medium, or low")
     title: str
     description: str
@@ -31,6 +39,8 @@ class AnalysisRequest(BaseModel):
     job_description: Optional[str] = None
 
 class AnalysisResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     file_name: str
     upload_date: datetime = Field(default_factory=datetime.utcnow)
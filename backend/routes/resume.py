@@ -1,25 +1,23 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 from fastapi.responses import JSONResponse
 from typing import Optional
+import asyncio
 import time
 import logging
 from datetime import datetime
+from pathlib import Path
 
 from services.resume_parser import ResumeParser
 from services.ats_analyzer import ATSAnalyzer
 from services.file_handler import FileHandler
+from services.job_description import normalize_job_description, MAX_JOB_DESCRIPTION_LENGTH
 from models.analysis import (
     AnalysisResult, 
     KeywordAnalysisRequest, 
-    KeywordAnalysisResult,
-    AnalysisHistory,
-    Issue,
-    Keyword,
-    SectionAnalysis,
-    Recommendation
+    KeywordAnalysisResult
 )
-from motor.motor_asyncio import AsyncIOMotorDatabase
-from database import get_database
+from pymongo.asynchronous.database import AsyncDatabase
+from database import get_database, analysis_writer, compress_text, decompress_text
 
 logger = logging.getLogger(__name__)
 
@@ -30,39 +28,98 @@ resume_parser = ResumeParser()
 ats_analyzer = ATSAnalyzer()
 file_handler = FileHandler()
 
+# Seconds between sweeps of stale uploads
+CLEANUP_INTERVAL = 3600
+
+async def periodic_cleanup(interval: int = CLEANUP_INTERVAL):
+    """Remove stale uploads in the background instead of on the request path"""
+    while True:
+        await asyncio.to_thread(file_handler.cleanup_old_files)
+        await asyncio.sleep(interval)
+
+cleanup_task: Optional[asyncio.Task] = None
+
+@router.on_event("startup")
+async def start_cleanup():
+    global cleanup_task
+    cleanup_task = asyncio.create_task(periodic_cleanup())
+
+@router.on_event("shutdown")
+async def stop_cleanup():
+    if cleanup_task is not None:
+        cleanup_task.cancel()
+
+# Reshape stored analysis documents into the AnalysisResult layout on the server
+# (inclusion projection, so the large original_text field is never sent back)
+ANALYSIS_PROJECTION = {
+    "_id": 0,
+    "id": "$_id",
+    "file_name": 1,
+    "upload_date": 1,
+    "overall_score": "$scores.overall",
+    "ats_compatibility": "$scores.ats_compatibility",
+    "keyword_match": "$scores.keyword_match",
+    "skills_match": "$scores.skills_match",
+    "format_score": "$scores.format_score",
+    "issues": "$analysis.issues",
+    "missing_keywords": "$analysis.missing_keywords",
+    "found_keywords": "$analysis.found_keywords",
+    "sections": "$analysis.sections",
+    "recommendations": "$analysis.recommendations",
+    "processing_time": "$metadata.processing_time",
+    "job_description": 1
+}
+
+# History rows only carry the fields shown in a listing
+HISTORY_PROJECTION = {
+    "_id": 0,
+    "id": "$_id",
+    "file_name": 1,
+    "upload_date": 1,
+    "overall_score": "$scores.overall",
+    "ats_compatibility": "$scores.ats_compatibility",
+    "keyword_match": "$scores.keyword_match",
+    "skills_match": "$scores.skills_match",
+    "format_score": "$scores.format_score",
+    "processing_time": "$metadata.processing_time",
+    "job_description": 1
+}
+
 @router.post("/analyze", response_model=dict)
 async def analyze_resume(
     file: UploadFile = File(...),
     job_description: Optional[str] = Form(None),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncDatabase = Depends(get_database)
 ):
     """
     Upload and analyze a resume file for ATS compatibility
     """
     start_time = time.time()
     
+    job_description = normalize_job_description(job_description)
+    if job_description and len(job_description) > MAX_JOB_DESCRIPTION_LENGTH:
+        raise HTTPException(status_code=413, detail="Job description too long. Maximum length is 20,000 characters.")
+    
     try:
         # Validate file
         if not file.filename:
             raise HTTPException(status_code=400, detail="No file provided")
         
-        # Read file content
-        file_content = await file.read()
-        
-        # Validate and save file
+        # Stream, validate and save file
         try:
-            file_handler.validate_file(file_content, file.filename, file.content_type)
-            file_path, file_type = await file_handler.save_uploaded_file(
-                file_content, file.filename, file.content_type
+            file_path, file_type, file_size = await file_handler.save_upload_stream(
+                file, file.filename, file.content_type
             )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         
-        # Parse resume
+        # Parse resume; the parser leaves its input alone, so the temporary upload is removed here
         try:
             parsed_resume = resume_parser.parse_resume(file_path, file_type)
         except Exception as e:
             raise HTTPException(status_code=422, detail=f"Could not parse resume: {str(e)}")
+        finally:
+            Path(file_path).unlink(missing_ok=True)
         
         # Analyze with ATS engine
         try:
@@ -81,14 +138,12 @@ async def analyze_resume(
             keyword_match=analysis['keyword_match'],
             skills_match=analysis['skills_match'],
             format_score=analysis['format_score'],
-            issues=[Issue(**issue) for issue in analysis['issues']],
-            missing_keywords=[Keyword(**kw) for kw in analysis['missing_keywords']],
-            found_keywords=[Keyword(**kw) for kw in analysis['found_keywords']],
-            sections={
-                name: SectionAnalysis(**section) 
-                for name, section in analysis['sections'].items()
-            },
-            recommendations=[Recommendation(**rec) for rec in analysis['recommendations']],
+            # Nested lists are validated in one pass by the outer model
+            issues=analysis['issues'],
+            missing_keywords=analysis['missing_keywords'],
+            found_keywords=analysis['found_keywords'],
+            sections=analysis['sections'],
+            recommendations=analysis['recommendations'],
             processing_time=processing_time,
             job_description=job_description
         )
@@ -98,9 +153,9 @@ async def analyze_resume(
             analysis_doc = {
                 "_id": result.id,
                 "file_name": result.file_name,
-                "file_size": len(file_content),
+                "file_size": file_size,
                 "upload_date": result.upload_date,
-                "original_text": parsed_resume.get('raw_text', ''),
+                "original_text": compress_text(parsed_resume.get('raw_text', '')),
                 "job_description": job_description,
                 "scores": {
                     "overall": result.overall_score,
@@ -110,11 +165,11 @@ async def analyze_resume(
                     "format_score": result.format_score
                 },
                 "analysis": {
-                    "issues": [issue.dict() for issue in result.issues],
-                    "missing_keywords": [kw.dict() for kw in result.missing_keywords],
-                    "found_keywords": [kw.dict() for kw in result.found_keywords],
-                    "sections": {name: section.dict() for name, section in result.sections.items()},
-                    "recommendations": [rec.dict() for rec in result.recommendations]
+                    "issues": [issue.model_dump() for issue in result.issues],
+                    "missing_keywords": [kw.model_dump(exclude_none=True) for kw in result.missing_keywords],
+                    "found_keywords": [kw.model_dump(exclude_none=True) for kw in result.found_keywords],
+                    "sections": {name: section.model_dump() for name, section in result.sections.items()},
+                    "recommendations": [rec.model_dump() for rec in result.recommendations]
                 },
                 "metadata": {
                     "file_type": file_type,
@@ -123,19 +178,16 @@ async def analyze_resume(
                 }
             }
             
-            await db.analyses.insert_one(analysis_doc)
-            logger.info(f"Analysis saved to database: {result.id}")
+            await analysis_writer.enqueue(analysis_doc)
+            logger.info(f"Analysis queued for database: {result.id}")
             
         except Exception as e:
             logger.error(f"Database save error: {str(e)}")
             # Continue without failing the request
         
-        # Clean up old files periodically
-        file_handler.cleanup_old_files()
-        
         return {
             "success": True,
-            "data": result.dict()
+            "data": result.model_dump(mode="json")
         }
         
     except HTTPException:
@@ -149,22 +201,26 @@ async def analyze_keywords(request: KeywordAnalysisRequest):
     """
     Analyze keyword matching between resume text and job description
     """
+    job_description = normalize_job_description(request.job_description) or request.job_description
+    if len(job_description) > MAX_JOB_DESCRIPTION_LENGTH:
+        raise HTTPException(status_code=413, detail="Job description too long. Maximum length is 20,000 characters.")
+    
     try:
         # Use ATS analyzer for keyword analysis
         keyword_analysis = ats_analyzer.analyze_keywords(
             request.resume_text, 
-            request.job_description
+            job_description
         )
         
         result = KeywordAnalysisResult(
-            missing_keywords=[Keyword(**kw) for kw in keyword_analysis['missing_keywords']],
-            found_keywords=[Keyword(**kw) for kw in keyword_analysis['found_keywords']],
+            missing_keywords=keyword_analysis['missing_keywords'],
+            found_keywords=keyword_analysis['found_keywords'],
             keyword_match=keyword_analysis['match_percentage']
         )
         
         return {
             "success": True,
-            "data": result.dict()
+            "data": result.model_dump(mode="json")
         }
         
     except Exception as e:
@@ -175,7 +231,7 @@ async def analyze_keywords(request: KeywordAnalysisRequest):
 async def get_analysis_history(
     page: int = 1,
     page_size: int = 10,
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncDatabase = Depends(get_database)
 ):
     """
     Get analysis history with pagination
@@ -192,62 +248,98 @@ async def get_analysis_history(
         # Calculate skip value
         skip = (page - 1) * page_size
         
-        # Get total count
-        total_count = await db.analyses.count_documents({})
-        
-        # Get analyses with pagination
-        cursor = db.analyses.find({}).sort("upload_date", -1).skip(skip).limit(page_size)
-        analyses_docs = await cursor.to_list(length=page_size)
+        # Fetch the page and the total count in one round-trip; the sort stays
+        # ahead of $facet so it can walk the upload_date index
+        pipeline = [
+            {"$sort": {"upload_date": -1}},
+            {"$facet": {
+                "items": [
+                    {"$skip": skip},
+                    {"$limit": page_size},
+                    {"$project": HISTORY_PROJECTION}
+                ],
+                "total": [{"$count": "n"}]
+            }}
+        ]
+        cursor = await db.analyses.aggregate(pipeline)
+        facets = (await cursor.to_list(length=1))[0]
         
-        # Convert to response format
-        analyses = []
-        for doc in analyses_docs:
-            try:
-                analysis = AnalysisResult(
-                    id=doc["_id"],
-                    file_name=doc["file_name"],
-                    upload_date=doc["upload_date"],
-                    overall_score=doc["scores"]["overall"],
-                    ats_compatibility=doc["scores"]["ats_compatibility"],
-                    keyword_match=doc["scores"]["keyword_match"],
-                    skills_match=doc["scores"]["skills_match"],
-                    format_score=doc["scores"]["format_score"],
-                    issues=[Issue(**issue) for issue in doc["analysis"]["issues"]],
-                    missing_keywords=[Keyword(**kw) for kw in doc["analysis"]["missing_keywords"]],
-                    found_keywords=[Keyword(**kw) for kw in doc["analysis"]["found_keywords"]],
-                    sections={
-                        name: SectionAnalysis(**section) 
-                        for name, section in doc["analysis"]["sections"].items()
-                    },
-                    recommendations=[Recommendation(**rec) for rec in doc["analysis"]["recommendations"]],
-                    processing_time=doc["metadata"].get("processing_time"),
-                    job_description=doc.get("job_description")
-                )
-                analyses.append(analysis)
-            except Exception as e:
-                logger.error(f"Error converting analysis doc: {str(e)}")
-                continue
-        
-        result = AnalysisHistory(
-            analyses=analyses,
-            total_count=total_count,
-            page=page,
-            page_size=page_size
-        )
+        analyses = facets["items"]
+        total_count = facets["total"][0]["n"] if facets["total"] else 0
         
         return {
             "success": True,
-            "data": result.dict()
+            "data": {
+                "analyses": analyses,
+                "total_count": total_count,
+                "page": page,
+                "page_size": page_size
+            }
         }
         
     except Exception as e:
         logger.error(f"History retrieval error: {str(e)}")
         raise HTTPException(status_code=500, detail="Could not retrieve history")
 
+@router.get("/analysis/{analysis_id}", response_model=dict)
+async def get_analysis(
+    analysis_id: str,
+    db: AsyncDatabase = Depends(get_database)
+):
+    """
+    Get the full result of a specific analysis
+    """
+    try:
+        doc = await db.analyses.find_one({"_id": analysis_id}, ANALYSIS_PROJECTION)
+        
+        if doc is None:
+            raise HTTPException(status_code=404, detail="Analysis not found")
+        
+        result = AnalysisResult.model_validate(doc)
+        
+        return {
+            "success": True,
+            "data": result.model_dump(mode="json")
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Analysis retrieval error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not retrieve analysis")
+
+@router.get("/analysis/{analysis_id}/text", response_model=dict)
+async def get_analysis_text(
+    analysis_id: str,
+    db: AsyncDatabase = Depends(get_database)
+):
+    """
+    Get the original resume text of a specific analysis
+    """
+    try:
+        doc = await db.analyses.find_one({"_id": analysis_id}, {"original_text": 1})
+        
+        if doc is None:
+            raise HTTPException(status_code=404, detail="Analysis not found")
+        
+        return {
+            "success": True,
+            "data": {
+                "id": analysis_id,
+                "original_text": decompress_text(doc.get("original_text", ""))
+            }
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Analysis text retrieval error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not retrieve analysis text")
+
 @router.delete("/analysis/{analysis_id}")
 async def delete_analysis(
     analysis_id: str,
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncDatabase = Depends(get_database)
 ):
     """
     Delete a specific analysis
@@ -1,16 +1,29 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import os
-import tempfile
+import io
+import copy
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple, Any, Awaitable, Callable
 import logging
+from functools import lru_cache
+import ahocorasick
+from cachetools import TTLCache
 
 # Import our comprehensive services
 from services.advanced_resume_parser import AdvancedResumeParser
 from services.comprehensive_ats_analyzer import ComprehensiveATSAnalyzer
+from services.job_description import normalize_job_description, MAX_JOB_DESCRIPTION_LENGTH
 
-app = FastAPI(title="Bruwrite ATS Resume Checker", version="3.0.0")
+app = FastAPI(
+    title="Bruwrite ATS Resume Checker",
+    version="3.0.0",
+    default_response_class=ORJSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,28 +39,63 @@ ats_analyzer = ComprehensiveATSAnalyzer()
 
 logger = logging.getLogger(__name__)
 
+# Upload limits
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Cache of finished responses keyed by content + form field digests
+analysis_cache = TTLCache(maxsize=512, ttl=3600)
+
+def analysis_cache_key(content_hash: str, job_description: Optional[str], job_title: Optional[str]) -> str:
+    """Build cache key from the upload digest and form fields"""
+    return ''.join([
+        content_hash,
+        hashlib.sha256((job_description or '').encode('utf-8')).hexdigest(),
+        hashlib.sha256((job_title or '').encode('utf-8')).hexdigest()
+    ])
+
+# Resume detection keyword sets
+RESUME_INDICATORS = [
+    'experience', 'education', 'skills', 'work', 'employment', 
+    'resume', 'cv', 'curriculum vitae', 'objective', 'summary',
+    'achievements', 'projects', 'certifications', 'qualifications',
+    'professional', 'career', 'position', 'responsibilities'
+]
+
+NON_RESUME_INDICATORS = [
+    'invoice', 'bill', 'payment', 'amount due', 'total amount',
+    'due date', 'billing', 'account number', 'transaction',
+    'receipt', 'purchase', 'order', 'refund', 'tax', 'electricity',
+    'utility', 'statement', 'balance', 'charges', 'fee'
+]
+
+CONTACT_INDICATORS = ['@', 'email']
+
+def build_indicator_automaton() -> ahocorasick.Automaton:
+    """Build one automaton matching all indicator sets in a single pass"""
+    automaton = ahocorasick.Automaton()
+    for indicator in RESUME_INDICATORS:
+        automaton.add_word(indicator, ('resume', indicator))
+    for indicator in NON_RESUME_INDICATORS:
+        automaton.add_word(indicator, ('non_resume', indicator))
+    for indicator in CONTACT_INDICATORS:
+        automaton.add_word(indicator, ('contact', indicator))
+    automaton.make_automaton()
+    return automaton
+
+indicator_automaton = build_indicator_automaton()
+
+@lru_cache(maxsize=256)
 def is_resume_content(text: str) -> bool:
     """Enhanced resume detection"""
     text_lower = text.lower()
     
-    # Strong resume indicators
-    resume_indicators = [
-        'experience', 'education', 'skills', 'work', 'employment', 
-        'resume', 'cv', 'curriculum vitae', 'objective', 'summary',
-        'achievements', 'projects', 'certifications', 'qualifications',
-        'professional', 'career', 'position', 'responsibilities'
-    ]
-    
-    # Strong non-resume indicators
-    non_resume_indicators = [
-        'invoice', 'bill', 'payment', 'amount due', 'total amount',
-        'due date', 'billing', 'account number', 'transaction',
-        'receipt', 'purchase', 'order', 'refund', 'tax', 'electricity',
-        'utility', 'statement', 'balance', 'charges', 'fee'
-    ]
-    
-    resume_score = sum(1 for indicator in resume_indicators if indicator in text_lower)
-    non_resume_score = sum(1 for indicator in non_resume_indicators if indicator in text_lower)
+    # Each indicator counts once, however often it appears
+    found_indicators = {match for _, match in indicator_automaton.iter(text_lower)}
+    found_categories = [category for category, _ in found_indicators]
+    resume_score = found_categories.count('resume')
+    non_resume_score = found_categories.count('non_resume')
+    has_contact = 'contact' in found_categories
     
     # Enhanced detection logic
     word_count = len(text.split())
@@ -57,11 +105,142 @@ def is_resume_content(text: str) -> bool:
         resume_score >= 3 and 
         non_resume_score < resume_score and 
         word_count >= 100 and
-        ('@' in text or 'email' in text_lower)  # Should have contact info
+        has_contact  # Should have contact info
     )
     
     return is_resume
 
+def run_analysis(content: bytes, file_type: str, job_description: Optional[str], job_title: Optional[str]) -> Optional[Tuple[int, Dict]]:
+    """Parse and analyze an upload in a worker process, returns None if it is not a resume"""
+    parsed_data = resume_parser.parse_resume(io.BytesIO(content), file_type)
+    
+    # Check if content is actually a resume
+    if not is_resume_content(parsed_data['raw_text']):
+        return None
+    
+    # Perform comprehensive ATS analysis
+    comprehensive_analysis = ats_analyzer.analyze_comprehensive(
+        parsed_data, job_description, job_title
+    )
+    return parsed_data['word_count'], comprehensive_analysis
+
+# Sample resume run once at startup so lazily loaded models and data are warm
+WARMUP_RESUME = b"""Jane Doe
+Software Engineer | jane.doe@example.com | (555) 123-4567 | linkedin.com/in/janedoe
+
+PROFESSIONAL SUMMARY
+Software engineer with 6 years of experience building scalable web applications and APIs.
+Skilled in Python, JavaScript, React, SQL and AWS, with a track record of improving system performance.
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp, 2020 - Present
+- Led development of microservices handling 2 million requests per day
+- Reduced page load time by 40% through caching and query optimization
+- Mentored 4 junior engineers and improved team delivery by 25%
+
+Software Engineer, Beta Inc, 2017 - 2020
+- Built REST APIs in Python and Flask used by 50,000 customers
+- Implemented automated testing that cut production bugs by 30%
+
+EDUCATION
+Bachelor of Science in Computer Science, State University, 2017
+
+SKILLS
+Python, JavaScript, React, SQL, Docker, AWS, Git, communication, leadership, teamwork
+
+CERTIFICATIONS
+AWS Certified Developer
+"""
+
+def warm_up_worker():
+    """Analyze the sample resume once when a worker starts, whatever the start method"""
+    try:
+        run_analysis(WARMUP_RESUME, 'txt', None, None)
+    except Exception as e:
+        logger.warning(f"Analysis warm-up failed: {str(e)}")
+
+# Worker processes for CPU-bound parsing and analysis
+analysis_pool: Optional[ProcessPoolExecutor] = None
+
+@app.on_event("startup")
+async def start_analysis_pool():
+    global analysis_pool
+    analysis_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=warm_up_worker)
+
+@app.on_event("shutdown")
+async def stop_analysis_pool():
+    if analysis_pool is not None:
+        analysis_pool.shutdown(wait=True)
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into a single execution"""
+    
+    def __init__(self):
+        self.calls: Dict[str, asyncio.Future] = {}
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func for the first caller of key, later callers await its result"""
+        future = self.calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self.calls[key] = future
+        try:
+            result = await func()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self.calls[key]
+
+# In-flight analyses keyed like analysis_cache, so identical concurrent uploads run once
+analysis_flights = SingleFlight()
+
+async def analyze_upload(cache_key: str, content: bytes, file_type: str, job_description: Optional[str], job_title: Optional[str]) -> Dict:
+    """Analyze an upload in the worker pool and cache the formatted response"""
+    # Parse and analyze in the worker pool so the event loop stays responsive
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        analysis_pool, run_analysis,
+        content, file_type, job_description, job_title
+    )
+    
+    if result is None:
+        raise HTTPException(
+            status_code=400,
+            detail="The uploaded document does not appear to be a resume. Please upload a valid resume file containing work experience, education, and skills information."
+        )
+    word_count, comprehensive_analysis = result
+    
+    # Format response for frontend compatibility; scores, recommendations and
+    # missing keywords are read from comprehensive_analysis, while the
+    # top-level fields are moved out so they are sent only once
+    response = {
+        # Key metrics
+        'total_keywords': comprehensive_analysis.pop('total_keywords'),
+        'sections_count': comprehensive_analysis.pop('sections_count'),
+        'word_count': word_count,
+        'readability_score': int(comprehensive_analysis['detailed_analysis']['formatting_readability']['score']),
+        
+        # Frontend format
+        'issues': comprehensive_analysis.pop('issues'),
+        
+        # Full analysis data for detailed view
+        'comprehensive_analysis': comprehensive_analysis
+    }
+    
+    analysis_cache[cache_key] = copy.deepcopy(response)
+    
+    return response
+
 @app.get("/api/")
 async def root():
     return {"message": "Bruwrite ATS Resume Checker API v3.0 - Comprehensive Analysis"}
@@ -86,83 +265,40 @@ async def analyze_resume_comprehensive(
             detail="Unsupported file type. Please upload PDF, DOCX, DOC, or TXT files."
         )
     
-    # Check file size (10MB limit)
-    content = await file.read()
-    if len(content) > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="File too large. Maximum size is 10MB.")
-    
-    if len(content) < 100:
-        raise HTTPException(status_code=400, detail="File appears to be empty or too small.")
-    
-    # Save file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name
+    # Normalize job description once so equivalent inputs share caches
+    job_description = normalize_job_description(job_description)
+    if job_description and len(job_description) > MAX_JOB_DESCRIPTION_LENGTH:
+        raise HTTPException(status_code=413, detail="Job description too long. Maximum length is 20,000 characters.")
     
     try:
-        # Parse resume with advanced parser
-        parsed_data = resume_parser.parse_resume(tmp_file_path, file_ext[1:])  # Remove dot from extension
-        
-        # Check if content is actually a resume
-        if not is_resume_content(parsed_data['raw_text']):
-            raise HTTPException(
-                status_code=400,
-                detail="The uploaded document does not appear to be a resume. Please upload a valid resume file containing work experience, education, and skills information."
-            )
-        
-        # Perform comprehensive ATS analysis
-        comprehensive_analysis = ats_analyzer.analyze_comprehensive(
-            parsed_data, job_description, job_title
-        )
+        # Read upload in chunks, hashing and checking size (10MB limit) as we go; the
+        # worker pool takes the bytes directly, so no temporary file is needed
+        content_hasher = hashlib.sha256()
+        file_size = 0
+        chunks = []
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_UPLOAD_SIZE:
+                raise HTTPException(status_code=400, detail="File too large. Maximum size is 10MB.")
+            content_hasher.update(chunk)
+            chunks.append(chunk)
         
-        # Format response for frontend compatibility
-        executive_summary = comprehensive_analysis['executive_summary']
-        ats_scorecard = comprehensive_analysis['ats_scorecard']
+        if file_size < 100:
+            raise HTTPException(status_code=400, detail="File appears to be empty or too small.")
         
-        response = {
-            # Executive Summary
-            'overall_score': executive_summary['overall_ats_score'],
-            'keyword_match': executive_summary['keyword_match'],
-            'skills_match': executive_summary['skills_match'],
-            'formatting_readability': executive_summary['formatting_readability'],
-            'summary_statement': executive_summary['summary_statement'],
-            
-            # Detailed scores for frontend display
-            'format_score': ats_scorecard['formatting_readability'],
-            'keyword_score': ats_scorecard['keyword_match'],
-            'skills_score': ats_scorecard['skills_match'],
-            'experience_score': ats_scorecard['experience_relevance'],
-            
-            # Key metrics
-            'total_keywords': len(comprehensive_analysis['detailed_analysis']['skills_section']['skills_found']['technical']) + 
-                             len(comprehensive_analysis['detailed_analysis']['skills_section']['skills_found']['soft']),
-            'sections_count': sum(1 for section in comprehensive_analysis['detailed_analysis'].values() 
-                                if isinstance(section, dict) and section.get('score', 0) > 0),
-            'word_count': len(parsed_data['raw_text'].split()),
-            'readability_score': int(comprehensive_analysis['detailed_analysis']['formatting_readability']['score']),
-            
-            # Convert detailed analysis to frontend format
-            'issues': [],
-            'recommendations': comprehensive_analysis['final_recommendations'],
-            'missing_keywords': comprehensive_analysis['detailed_analysis']['keywords_relevance'].get('missing_keywords', []),
-            
-            # Full analysis data for detailed view
-            'comprehensive_analysis': comprehensive_analysis,
-            'pie_chart_data': comprehensive_analysis['pie_chart_data']
-        }
+        # Return cached analysis for identical resume + job inputs
+        cache_key = analysis_cache_key(content_hasher.hexdigest(), job_description, job_title)
+        cached_response = analysis_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
         
-        # Convert detailed analysis to issues format
-        detailed_analysis = comprehensive_analysis['detailed_analysis']
-        
-        for section_name, section_data in detailed_analysis.items():
-            if isinstance(section_data, dict) and 'recommendations' in section_data:
-                for rec in section_data['recommendations']:
-                    severity = 'critical' if section_data.get('score', 100) < 50 else 'warning'
-                    response['issues'].append({
-                        'severity': severity,
-                        'title': f"{section_name.replace('_', ' ').title()} Issue",
-                        'description': rec
-                    })
+        # Identical uploads already being analyzed share the in-flight result
+        response = await analysis_flights.do(
+            cache_key,
+            lambda: analyze_upload(
+                cache_key, b''.join(chunks), file_ext[1:], job_description, job_title  # Remove dot from extension
+            )
+        )
         
         return response
         
@@ -173,11 +309,4 @@ async def analyze_resume_comprehensive(
         raise HTTPException(
             status_code=500, 
             detail=f"Analysis failed: {str(e)}. Please ensure your file contains readable text and is a valid resume."
-        )
-    
-    finally:
-        # Clean up temporary file
-        try:
-            os.unlink(tmp_file_path)
-        except:
-            pass
\ No newline at end of file
+        )
\ No newline at end of file
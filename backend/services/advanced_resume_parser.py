@@ -1,33 +1,76 @@
-import fitz  # PyMuPDF
-from docx import Document
 import re
-import os
+import io
+import copy
+import hashlib
 import tempfile
-from typing import Dict, List, Tuple, Optional
-import nltk
-import spacy
-import textstat
+import zipfile
+from typing import Dict, List, Tuple, Optional, Union, BinaryIO
 from collections import Counter
+from functools import lru_cache
 import logging
+import ahocorasick
+from cachetools import LRUCache
+
+from services.batch import run_batch
 
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('taggers/averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('averaged_perceptron_tagger')
+# Heavy libraries (PyMuPDF, lxml, spaCy) are imported
+# inside the functions that use them to keep module import light
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """Load the spaCy model on first use, without the components the parser does not need"""
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm", exclude=["ner", "lemmatizer", "attribute_ruler", "parser"])
+    except OSError:
+        logger.warning("spaCy model not found, some features may be limited")
+        return None
+
+# Precompiled patterns shared by the extractors; ASCII matching where the pattern
+# targets ASCII tokens (emails, phones, years, degrees), Unicode where accented
+# names or non-breaking spaces must still count as word/space characters
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.ASCII)
+PHONE_PATTERN = re.compile(r'(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})', re.ASCII)
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE | re.ASCII)
+NUMBERS_PATTERN = re.compile(r'\b\d+(?:\.\d+)?(?:%|k|million|billion|\$|,\d{3})*\b', re.ASCII)
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b', re.ASCII)
+COMPANY_PATTERN = re.compile(r'\s+at\s+\w+|\s+with\s+\w+|\w+\s*\|', re.IGNORECASE | re.ASCII)
+DEGREE_PATTERNS = [
+    re.compile(r'\b(bachelor|master|phd|doctorate|associate|diploma)\b', re.ASCII),
+    re.compile(r'\b(b\.?[sa]\.?|m\.?[sa]\.?|ph\.?d\.?|m\.?b\.?a\.?)\b', re.ASCII),
+    re.compile(r'\b(undergraduate|graduate|postgraduate)\b', re.ASCII)
+]
+GPA_PATTERN = re.compile(r'gpa\s*:?\s*([0-9]\.[0-9])', re.ASCII)
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+DOUBLE_SPACE_PATTERN = re.compile(r'\s{2,}')
+MISSING_SPACE_PATTERN = re.compile(r'[a-z]\.[A-Z]')
+# Runs of whitespace and characters an ATS would drop, replaced by one space
+ATS_CLEAN_PATTERN = re.compile(r'[^\w@.-]+')
+VOWEL_GROUP_PATTERN = re.compile(r'[aeiouy]+')
+
+# WordprocessingML namespace used when reading DOCX XML directly
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Keyword categories that only count as whole words ("lead" must not match "leaded",
+# "age" must not match "manage")
+WHOLE_WORD_CATEGORIES = {'tech_skills', 'soft_skills', 'action_verbs', 'job_titles', 'bias'}
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logger.warning("spaCy model not found, some features may be limited")
-    nlp = None
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Estimate syllables in a lowercased word from its vowel groups"""
+    syllables = len(VOWEL_GROUP_PATTERN.findall(word))
+    # Silent trailing 'e' as in "manage", but not "le" as in "title"
+    if syllables > 1 and word.endswith('e') and not word.endswith('le'):
+        syllables -= 1
+    return max(1, syllables)
+
+def is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not part of a longer word"""
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or before == '_' or after.isalnum() or after == '_')
 
 class AdvancedResumeParser:
     def __init__(self):
@@ -35,6 +78,7 @@ class AdvancedResumeParser:
             'arial', 'calibri', 'times new roman', 'helvetica', 
             'georgia', 'trebuchet ms', 'verdana'
         ]
+        self.ats_font_pattern = re.compile('|'.join(map(re.escape, self.ats_friendly_fonts)))
         
         self.standard_sections = [
             'work experience', 'professional experience', 'experience', 'employment',
@@ -87,12 +131,87 @@ class AdvancedResumeParser:
             'cissp', 'cisa', 'cism', 'comptia', 'cisco certified', 'microsoft certified',
             'salesforce certified', 'scrum master', 'six sigma', 'itil'
         ]
+        
+        self.job_titles = [
+            'manager', 'director', 'engineer', 'developer', 'analyst', 'specialist',
+            'coordinator', 'assistant', 'supervisor', 'lead', 'senior', 'junior'
+        ]
+        
+        self.institution_keywords = ['university', 'college', 'institute', 'school', 'academy']
+        
+        self.bias_keywords = ['age', 'married', 'single', 'gender', 'race', 'religion', 'photo']
+        
+        self.section_keywords = {
+            'work_experience': ['work experience', 'professional experience', 'experience', 'employment', 'career'],
+            'education': ['education', 'academic background', 'qualifications', 'degree'],
+            'skills': ['skills', 'technical skills', 'competencies', 'technologies', 'expertise'],
+            'certifications': ['certifications', 'certificates', 'licenses', 'credentials'],
+            'summary': ['summary', 'professional summary', 'objective', 'profile', 'about'],
+            'contact': ['contact', 'personal information']
+        }
+        
+        self.keyword_automaton = self.build_keyword_automaton()
+        self.section_automaton = self.build_section_automaton()
+        
+        # Parsed results keyed by (content digest, file type)
+        self.parse_cache = LRUCache(maxsize=256)
+
+    def build_keyword_automaton(self) -> ahocorasick.Automaton:
+        """Build one automaton matching every keyword list in a single pass"""
+        vocabularies = {
+            'tech_skills': self.tech_skills,
+            'soft_skills': self.soft_skills,
+            'certifications': self.certifications,
+            'action_verbs': self.action_verbs,
+            'job_titles': self.job_titles,
+            'institutions': self.institution_keywords,
+            'bias': self.bias_keywords
+        }
+        automaton = ahocorasick.Automaton()
+        for category, keywords in vocabularies.items():
+            for keyword in keywords:
+                # A keyword may belong to several categories
+                _, categories = automaton.get(keyword, (keyword, ()))
+                automaton.add_word(keyword, (keyword, categories + (category,)))
+        automaton.make_automaton()
+        return automaton
+
+    def build_section_automaton(self) -> ahocorasick.Automaton:
+        """Build an automaton mapping section header keywords to their sections"""
+        automaton = ahocorasick.Automaton()
+        for section_key, keywords in self.section_keywords.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, automaton.get(keyword, ()) + (section_key,))
+        automaton.make_automaton()
+        return automaton
 
-    def extract_text_from_pdf(self, file_path: str) -> Tuple[str, Dict]:
+    def find_non_ats_fonts(self, fonts_used: set) -> List[str]:
+        """Return the lowercased font names that contain no ATS-friendly font name"""
+        return [font for font in fonts_used if self.ats_font_pattern.search(font) is None]
+
+    def scan_keywords(self, text_lower: str) -> Dict[str, set]:
+        """Find which keywords of each category occur in lowercased text"""
+        found = {}
+        for end_index, (keyword, categories) in self.keyword_automaton.iter(text_lower):
+            whole_word = is_whole_word(text_lower, end_index - len(keyword) + 1, end_index + 1)
+            for category in categories:
+                if whole_word or category not in WHOLE_WORD_CATEGORIES:
+                    found.setdefault(category, set()).add(keyword)
+        return found
+
+    def extract_text_from_pdf(self, file_path: Union[str, BinaryIO]) -> Tuple[str, Dict]:
         """Extract text from PDF and analyze formatting"""
         try:
-            doc = fitz.open(file_path)
-            text = ""
+            import pymupdf as fitz
+        except ImportError:
+            import fitz  # PyMuPDF before 1.24
+        
+        try:
+            if isinstance(file_path, str):
+                doc = fitz.open(file_path)
+            else:
+                doc = fitz.open(stream=file_path.read(), filetype="pdf")
+            page_texts = []
             formatting_info = {
                 'total_pages': len(doc),
                 'has_images': False,
@@ -104,7 +223,7 @@ class AdvancedResumeParser:
             for page in doc:
                 # Extract text
                 page_text = page.get_text()
-                text += page_text + "\n"
+                page_texts.append(page_text)
                 
                 # Check for images
                 if page.get_images():
@@ -114,22 +233,19 @@ class AdvancedResumeParser:
                 if '\t' in page_text or '|' in page_text:
                     formatting_info['has_tables'] = True
                 
-                # Extract font information
-                blocks = page.get_text("dict")["blocks"]
-                for block in blocks:
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                font_name = span.get("font", "").lower()
-                                if font_name:
-                                    formatting_info['fonts_used'].add(font_name)
+                # Extract font information from the page's font resources
+                for font in page.get_fonts():
+                    # Drop the subset tag, e.g. "ABCDEF+Calibri"
+                    font_name = font[3].split('+', 1)[-1].lower()
+                    if font_name:
+                        formatting_info['fonts_used'].add(font_name)
             
             doc.close()
+            text = "\n".join(page_texts)
             
             # Check for ATS-friendly fonts
             if formatting_info['fonts_used']:
-                non_ats_fonts = [f for f in formatting_info['fonts_used'] 
-                               if not any(ats_font in f for ats_font in self.ats_friendly_fonts)]
+                non_ats_fonts = self.find_non_ats_fonts(formatting_info['fonts_used'])
                 if non_ats_fonts:
                     formatting_info['formatting_issues'].append(
                         f"Non-ATS friendly fonts detected: {', '.join(list(non_ats_fonts)[:3])}"
@@ -147,41 +263,80 @@ class AdvancedResumeParser:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise Exception(f"Failed to parse PDF: {str(e)}")
 
-    def extract_text_from_docx(self, file_path: str) -> Tuple[str, Dict]:
+    def docx_paragraph_text(self, paragraph, fonts_used: Optional[set] = None) -> str:
+        """Join the run text of a w:p element, collecting run fonts when asked"""
+        parts = []
+        for child in paragraph:
+            if child.tag == WORD_NAMESPACE + 'r':
+                runs = [child]
+            elif child.tag == WORD_NAMESPACE + 'hyperlink':
+                runs = child.iterfind(WORD_NAMESPACE + 'r')
+            else:
+                continue
+            for run in runs:
+                if fonts_used is not None:
+                    font = run.find(f'{WORD_NAMESPACE}rPr/{WORD_NAMESPACE}rFonts')
+                    if font is not None and font.get(WORD_NAMESPACE + 'ascii'):
+                        fonts_used.add(font.get(WORD_NAMESPACE + 'ascii').lower())
+                for element in run:
+                    tag = element.tag[len(WORD_NAMESPACE):]
+                    if tag == 't':
+                        parts.append(element.text or '')
+                    elif tag in ('tab', 'ptab'):
+                        parts.append('\t')
+                    elif tag == 'cr' or (tag == 'br' and element.get(WORD_NAMESPACE + 'type', 'textWrapping') == 'textWrapping'):
+                        parts.append('\n')
+                    elif tag == 'noBreakHyphen':
+                        parts.append('-')
+        return ''.join(parts)
+
+    def extract_text_from_docx(self, file_path: Union[str, BinaryIO]) -> Tuple[str, Dict]:
         """Extract text from DOCX and analyze formatting"""
+        from lxml import etree
+        
         try:
-            doc = Document(file_path)
             text = []
+            table_text = []
             formatting_info = {
                 'has_images': False,
-                'has_tables': len(doc.tables) > 0,
+                'has_tables': False,
                 'fonts_used': set(),
                 'formatting_issues': []
             }
             
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text.append(paragraph.text)
+            # Stream word/document.xml instead of building the python-docx object model
+            with zipfile.ZipFile(file_path) as docx_zip:
+                formatting_info['has_images'] = any(
+                    name.startswith('word/media/') for name in docx_zip.namelist()
+                )
                 
-                # Check fonts
-                for run in paragraph.runs:
-                    if run.font.name:
-                        formatting_info['fonts_used'].add(run.font.name.lower())
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text.append(cell.text)
+                with docx_zip.open('word/document.xml') as document_xml:
+                    for _, element in etree.iterparse(
+                        document_xml, events=('end',),
+                        tag=(WORD_NAMESPACE + 'p', WORD_NAMESPACE + 'tbl')
+                    ):
+                        # Only top-level blocks; nested paragraphs are read with their table
+                        parent = element.getparent()
+                        if parent is None or parent.tag != WORD_NAMESPACE + 'body':
+                            continue
+                        
+                        if element.tag == WORD_NAMESPACE + 'p':
+                            text.append(self.docx_paragraph_text(element, formatting_info['fonts_used']))
+                        else:
+                            formatting_info['has_tables'] = True
+                            for cell in element.iterfind(f'{WORD_NAMESPACE}tr/{WORD_NAMESPACE}tc'):
+                                table_text.append('\n'.join(
+                                    self.docx_paragraph_text(paragraph)
+                                    for paragraph in cell.iterfind(WORD_NAMESPACE + 'p')
+                                ))
+                        
+                        # Free processed blocks to keep memory flat on large documents
+                        element.clear()
+                        while element.getprevious() is not None:
+                            del parent[0]
             
-            # Check for images
-            from docx.oxml.ns import nsdecls, qn
-            from docx.oxml import parse_xml
-            
-            for rel in doc.part.rels.values():
-                if "image" in rel.target_ref:
-                    formatting_info['has_images'] = True
-                    break
+            # Table text follows the body paragraphs
+            text.extend(table_text)
             
             # Check formatting issues
             if formatting_info['has_tables']:
@@ -192,8 +347,7 @@ class AdvancedResumeParser:
             
             # Check fonts
             if formatting_info['fonts_used']:
-                non_ats_fonts = [f for f in formatting_info['fonts_used'] 
-                               if not any(ats_font in f for ats_font in self.ats_friendly_fonts)]
+                non_ats_fonts = self.find_non_ats_fonts(formatting_info['fonts_used'])
                 if non_ats_fonts:
                     formatting_info['formatting_issues'].append(
                         f"Non-ATS friendly fonts: {', '.join(list(non_ats_fonts)[:3])}"
@@ -205,64 +359,89 @@ class AdvancedResumeParser:
             logger.error(f"Error extracting text from DOCX: {str(e)}")
             raise Exception(f"Failed to parse DOCX: {str(e)}")
 
-    def parse_resume(self, file_path: str, file_type: str) -> Dict:
-        """Main parsing function"""
+    def parse_resumes(self, jobs: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict]:
+        """Parse many (file_path, file_type) jobs in worker processes, results in input order"""
+        # PyMuPDF is not thread-safe, so batches use processes; the pool size bounds concurrency
+        file_paths = [file_path for file_path, _ in jobs]
+        file_types = [file_type for _, file_type in jobs]
+        return run_batch(parse_resume_job, file_paths, file_types, max_workers=max_workers)
+
+    def parse_resume(self, file_path: Union[str, BinaryIO], file_type: str) -> Dict:
+        """Main parsing function, accepts a file path or a binary file object"""
         try:
-            if file_type.lower() == 'pdf':
-                text, formatting_info = self.extract_text_from_pdf(file_path)
-            elif file_type.lower() in ['docx', 'doc']:
-                text, formatting_info = self.extract_text_from_docx(file_path)
+            if isinstance(file_path, str):
+                with open(file_path, 'rb') as f:
+                    content = f.read()
             else:
-                # For TXT files
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read().strip()
-                formatting_info = {'formatting_issues': [], 'fonts_used': set(), 'has_images': False, 'has_tables': False}
-            
-            if not text or len(text.strip()) < 100:
-                raise Exception("Could not extract meaningful text from resume. Please ensure the file contains readable text.")
+                content = file_path.read()
             
-            # Comprehensive analysis
-            parsed_data = {
-                'raw_text': text,
-                'file_type': file_type,
-                'formatting_info': formatting_info,
-                'contact_info': self.extract_contact_info(text),
-                'sections': self.detect_sections(text),
-                'work_experience': self.analyze_work_experience(text),
-                'education': self.extract_education(text),
-                'skills': self.extract_skills(text),
-                'certifications': self.extract_certifications(text),
-                'readability': self.analyze_readability(text),
-                'grammar_issues': self.check_grammar_basic(text),
-                'ats_parsing_test': self.simulate_ats_parsing(text)
-            }
+            # Re-uploads of the same file reuse the earlier parse
+            cache_key = (hashlib.blake2b(content, digest_size=16).hexdigest(), file_type)
+            parsed_data = self.parse_cache.get(cache_key)
+            if parsed_data is None:
+                parsed_data = self.parse_content(content, file_type)
+                self.parse_cache[cache_key] = parsed_data
             
-            return parsed_data
+            # Callers get their own copy so the cached result stays intact
+            return copy.deepcopy(parsed_data)
             
         except Exception as e:
             logger.error(f"Error parsing resume: {str(e)}")
             raise e
-        finally:
-            # Clean up uploaded file
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except:
-                    pass
 
-    def extract_contact_info(self, text: str) -> Dict:
+    def parse_content(self, content: bytes, file_type: str) -> Dict:
+        """Extract and analyze the raw bytes of a resume file"""
+        if file_type.lower() == 'pdf':
+            text, formatting_info = self.extract_text_from_pdf(io.BytesIO(content))
+        elif file_type.lower() in ['docx', 'doc']:
+            text, formatting_info = self.extract_text_from_docx(io.BytesIO(content))
+        else:
+            # For TXT files
+            reader = io.TextIOWrapper(io.BytesIO(content), encoding='utf-8', errors='ignore')
+            text = reader.read().strip()
+            formatting_info = {'formatting_issues': [], 'fonts_used': set(), 'has_images': False, 'has_tables': False}
+        
+        if not text or len(text.strip()) < 100:
+            raise Exception("Could not extract meaningful text from resume. Please ensure the file contains readable text.")
+        
+        # Lowercase once and share it with every extractor
+        text_lower = text.lower()
+        # Split sentences once for readability and grammar checks
+        sentences = SENTENCE_END_PATTERN.split(text)
+        readability = self.analyze_readability(text, sentences)
+        found_keywords = self.scan_keywords(text_lower)
+        
+        # Comprehensive analysis
+        parsed_data = {
+            'raw_text': text,
+            'file_type': file_type,
+            'formatting_info': formatting_info,
+            'contact_info': self.extract_contact_info(text, found_keywords),
+            'sections': self.detect_sections(text, text_lower),
+            'work_experience': self.analyze_work_experience(text, found_keywords),
+            'education': self.extract_education(text, found_keywords, text_lower),
+            'skills': self.extract_skills(text, found_keywords),
+            'certifications': self.extract_certifications(text, found_keywords),
+            'readability': readability,
+            'word_count': readability['word_count'],
+            'grammar_issues': self.check_grammar_basic(text, sentences),
+            'ats_parsing_test': self.simulate_ats_parsing(text)
+        }
+        
+        return parsed_data
+
+    def extract_contact_info(self, text: str, found_keywords: Optional[Dict[str, set]] = None) -> Dict:
         """Extract contact information"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
+        if found_keywords is None:
+            found_keywords = self.scan_keywords(text.lower())
         
-        emails = re.findall(email_pattern, text)
-        phones = re.findall(phone_pattern, text)
-        linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
+        emails = EMAIL_PATTERN.findall(text)
+        phones = PHONE_PATTERN.findall(text)
+        linkedin = LINKEDIN_PATTERN.findall(text)
         
         # Check for bias-sensitive information
-        bias_keywords = ['age', 'married', 'single', 'gender', 'race', 'religion', 'photo']
-        bias_issues = [keyword for keyword in bias_keywords if keyword.lower() in text.lower()]
+        bias_found = found_keywords.get('bias', set())
+        bias_issues = [keyword for keyword in self.bias_keywords if keyword in bias_found]
         
         return {
             'emails': emails,
@@ -274,68 +453,64 @@ class AdvancedResumeParser:
             'bias_issues': bias_issues
         }
 
-    def detect_sections(self, text: str) -> Dict:
+    def detect_sections(self, text: str, text_lower: Optional[str] = None) -> Dict:
         """Detect resume sections"""
-        lines = text.split('\n')
-        sections_found = {}
+        if text_lower is None:
+            text_lower = text.lower()
+        stripped_lines = [line.strip() for line in text.split('\n')]
+        lines_lower = text_lower.split('\n')
         
         # Initialize all sections as not found
-        section_map = {
-            'work_experience': ['work experience', 'professional experience', 'experience', 'employment', 'career'],
-            'education': ['education', 'academic background', 'qualifications', 'degree'],
-            'skills': ['skills', 'technical skills', 'competencies', 'technologies', 'expertise'],
-            'certifications': ['certifications', 'certificates', 'licenses', 'credentials'],
-            'summary': ['summary', 'professional summary', 'objective', 'profile', 'about'],
-            'contact': ['contact', 'personal information']
-        }
-        
-        for section_key, keywords in section_map.items():
-            sections_found[section_key] = {
+        sections_found = {
+            section_key: {
                 'found': False,
                 'header_line': None,
                 'content_lines': []
             }
-            
-            for i, line in enumerate(lines):
-                line_lower = line.strip().lower()
-                if any(keyword in line_lower for keyword in keywords):
+            for section_key in self.section_keywords
+        }
+        
+        # One sweep over the lines; each section takes the first line holding one of its keywords
+        remaining = len(sections_found)
+        for i, line_lower in enumerate(lines_lower):
+            for _, section_keys in self.section_automaton.iter(line_lower):
+                for section_key in section_keys:
+                    if sections_found[section_key]['found']:
+                        continue
                     sections_found[section_key]['found'] = True
                     sections_found[section_key]['header_line'] = i
                     
-                    # Extract content (next 10 lines or until next section)
-                    content_lines = []
-                    for j in range(i + 1, min(i + 11, len(lines))):
-                        if lines[j].strip():
-                            content_lines.append(lines[j].strip())
-                    sections_found[section_key]['content_lines'] = content_lines
-                    break
+                    # Extract content (non-empty lines among the next 10)
+                    sections_found[section_key]['content_lines'] = [
+                        line for line in stripped_lines[i + 1:i + 11] if line
+                    ]
+                    remaining -= 1
+            if remaining == 0:
+                break
         
         return sections_found
 
-    def analyze_work_experience(self, text: str) -> Dict:
+    def analyze_work_experience(self, text: str, found_keywords: Optional[Dict[str, set]] = None) -> Dict:
         """Analyze work experience section"""
-        text_lower = text.lower()
+        if found_keywords is None:
+            found_keywords = self.scan_keywords(text.lower())
         
         # Check for quantified achievements
-        numbers_pattern = r'\b\d+(?:\.\d+)?(?:%|k|million|billion|\$|,\d{3})*\b'
-        quantified_achievements = len(re.findall(numbers_pattern, text))
+        quantified_achievements = len(NUMBERS_PATTERN.findall(text))
         
         # Count action verbs
-        action_verb_count = sum(1 for verb in self.action_verbs if verb in text_lower)
+        action_verb_count = len(found_keywords.get('action_verbs', ()))
         
         # Check for reverse chronological order (look for years)
-        years = re.findall(r'\b(19|20)\d{2}\b', text)
+        years = YEAR_PATTERN.findall(text)
         is_chronological = len(years) >= 2 and years == sorted(years, reverse=True)
         
         # Check for job titles
-        common_titles = [
-            'manager', 'director', 'engineer', 'developer', 'analyst', 'specialist',
-            'coordinator', 'assistant', 'supervisor', 'lead', 'senior', 'junior'
-        ]
-        job_titles_found = [title for title in common_titles if title in text_lower]
+        titles_found = found_keywords.get('job_titles', set())
+        job_titles_found = [title for title in self.job_titles if title in titles_found]
         
         # Check for company names (look for "at", "with", "|" patterns)
-        company_indicators = len(re.findall(r'\s+at\s+\w+|\s+with\s+\w+|\w+\s*\|', text, re.IGNORECASE))
+        company_indicators = len(COMPANY_PATTERN.findall(text))
         
         return {
             'quantified_achievements': quantified_achievements,
@@ -346,31 +521,23 @@ class AdvancedResumeParser:
             'years_mentioned': len(years)
         }
 
-    def extract_education(self, text: str) -> Dict:
+    def extract_education(self, text: str, found_keywords: Optional[Dict[str, set]] = None, text_lower: Optional[str] = None) -> Dict:
         """Extract education information"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        if found_keywords is None:
+            found_keywords = self.scan_keywords(text_lower)
         
         # Degree patterns
-        degree_patterns = [
-            r'\b(bachelor|master|phd|doctorate|associate|diploma)\b',
-            r'\b(b\.?[sa]\.?|m\.?[sa]\.?|ph\.?d\.?|m\.?b\.?a\.?)\b',
-            r'\b(undergraduate|graduate|postgraduate)\b'
-        ]
-        
         degrees = []
-        for pattern in degree_patterns:
-            degrees.extend(re.findall(pattern, text_lower))
+        for pattern in DEGREE_PATTERNS:
+            degrees.extend(pattern.findall(text_lower))
         
-        # University/College patterns
-        institution_keywords = ['university', 'college', 'institute', 'school', 'academy']
-        institutions = []
-        for keyword in institution_keywords:
-            if keyword in text_lower:
-                institutions.append(keyword)
+        # University/College keywords
+        institutions = found_keywords.get('institutions', set())
         
         # GPA pattern
-        gpa_pattern = r'gpa\s*:?\s*([0-9]\.[0-9])'
-        gpa_matches = re.findall(gpa_pattern, text_lower)
+        gpa_matches = GPA_PATTERN.findall(text_lower)
         
         return {
             'degrees_found': list(set(degrees)),
@@ -379,12 +546,16 @@ class AdvancedResumeParser:
             'gpa_values': gpa_matches
         }
 
-    def extract_skills(self, text: str) -> Dict:
+    def extract_skills(self, text: str, found_keywords: Optional[Dict[str, set]] = None) -> Dict:
         """Extract and categorize skills"""
-        text_lower = text.lower()
+        if found_keywords is None:
+            found_keywords = self.scan_keywords(text.lower())
         
-        tech_skills_found = [skill for skill in self.tech_skills if skill in text_lower]
-        soft_skills_found = [skill for skill in self.soft_skills if skill in text_lower]
+        # Keep vocabulary order in the results
+        tech_found = found_keywords.get('tech_skills', set())
+        soft_found = found_keywords.get('soft_skills', set())
+        tech_skills_found = [skill for skill in self.tech_skills if skill in tech_found]
+        soft_skills_found = [skill for skill in self.soft_skills if skill in soft_found]
         
         # Calculate skill diversity
         total_skills = len(tech_skills_found) + len(soft_skills_found)
@@ -398,62 +569,68 @@ class AdvancedResumeParser:
             'skills_diversity_score': min(100, total_skills * 5)
         }
 
-    def extract_certifications(self, text: str) -> Dict:
+    def extract_certifications(self, text: str, found_keywords: Optional[Dict[str, set]] = None) -> Dict:
         """Extract certifications"""
-        text_lower = text.lower()
+        if found_keywords is None:
+            found_keywords = self.scan_keywords(text.lower())
         
-        certifications_found = []
-        for cert in self.certifications:
-            if cert in text_lower:
-                certifications_found.append(cert)
+        certs_found = found_keywords.get('certifications', set())
+        certifications_found = [cert for cert in self.certifications if cert in certs_found]
         
         return {
             'certifications_found': certifications_found,
             'certifications_count': len(certifications_found)
         }
 
-    def analyze_readability(self, text: str) -> Dict:
+    def analyze_readability(self, text: str, sentences: Optional[List[str]] = None) -> Dict:
         """Analyze text readability"""
-        try:
-            flesch_reading_ease = textstat.flesch_reading_ease(text)
-            flesch_grade = textstat.flesch_kincaid_grade(text)
-            word_count = len(text.split())
-            sentence_count = len(re.findall(r'[.!?]+', text))
-            
-            # Calculate average sentence length
-            avg_sentence_length = word_count / max(sentence_count, 1)
-            
-            return {
-                'flesch_reading_ease': flesch_reading_ease,
-                'flesch_grade_level': flesch_grade,
-                'word_count': word_count,
-                'sentence_count': sentence_count,
-                'avg_sentence_length': avg_sentence_length,
-                'readability_score': min(100, max(0, flesch_reading_ease))
-            }
-        except:
+        if sentences is None:
+            sentences = SENTENCE_END_PATTERN.split(text)
+        # Splitting on sentence endings yields one more piece than there are endings
+        sentence_count = len(sentences) - 1
+        
+        words = text.split()
+        word_count = len(words)
+        if word_count == 0:
             return {
                 'flesch_reading_ease': 50,
                 'flesch_grade_level': 8,
-                'word_count': len(text.split()),
-                'sentence_count': len(re.findall(r'[.!?]+', text)),
+                'word_count': 0,
+                'sentence_count': sentence_count,
                 'avg_sentence_length': 15,
                 'readability_score': 50
             }
+        
+        # Flesch formulas computed from one word split and one syllable count
+        syllable_count = sum(count_syllables(word) for word in text.lower().split())
+        avg_sentence_length = word_count / max(sentence_count, 1)
+        avg_syllables_per_word = syllable_count / word_count
+        flesch_reading_ease = round(206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word, 2)
+        flesch_grade = round(0.39 * avg_sentence_length + 11.8 * avg_syllables_per_word - 15.59, 2)
+        
+        return {
+            'flesch_reading_ease': flesch_reading_ease,
+            'flesch_grade_level': flesch_grade,
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'avg_sentence_length': avg_sentence_length,
+            'readability_score': min(100, max(0, flesch_reading_ease))
+        }
 
-    def check_grammar_basic(self, text: str) -> List[str]:
+    def check_grammar_basic(self, text: str, sentences: Optional[List[str]] = None) -> List[str]:
         """Basic grammar and spelling check"""
         issues = []
         
         # Check for common issues
-        if re.search(r'\s{2,}', text):
+        if DOUBLE_SPACE_PATTERN.search(text):
             issues.append("Multiple consecutive spaces found")
         
-        if re.search(r'[a-z]\.[A-Z]', text):
+        if MISSING_SPACE_PATTERN.search(text):
             issues.append("Missing space after period")
         
         # Check for incomplete sentences
-        sentences = re.split(r'[.!?]+', text)
+        if sentences is None:
+            sentences = SENTENCE_END_PATTERN.split(text)
         short_sentences = [s for s in sentences if len(s.strip().split()) < 3 and len(s.strip()) > 0]
         if len(short_sentences) > len(sentences) * 0.3:
             issues.append("Many incomplete or very short sentences")
@@ -462,9 +639,8 @@ class AdvancedResumeParser:
 
     def simulate_ats_parsing(self, text: str) -> Dict:
         """Simulate how an ATS might parse the resume"""
-        # Remove special characters and formatting
-        cleaned_text = re.sub(r'[^\w\s@.-]', ' ', text)
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+        # Remove special characters and formatting, collapsing whitespace in the same pass
+        cleaned_text = ATS_CLEAN_PATTERN.sub(' ', text)
         
         # Check what might be lost in parsing
         parsing_issues = []
@@ -482,4 +658,16 @@ class AdvancedResumeParser:
             'parsing_efficiency': (len(cleaned_text) / len(text)) * 100,
             'parseable_sections': parseable_sections,
             'parsing_issues': parsing_issues
-        }
\ No newline at end of file
+        }
+
+@lru_cache(maxsize=1)
+def get_batch_parser() -> AdvancedResumeParser:
+    """Parser shared by every parse job a worker process runs"""
+    return AdvancedResumeParser()
+
+def parse_resume_job(file_path: str, file_type: str) -> Dict:
+    """Parse one file for parse_resumes; failures come back as entries naming the file"""
+    try:
+        return get_batch_parser().parse_resume(file_path, file_type)
+    except Exception as e:
+        return {'file_path': file_path, 'error': str(e)}
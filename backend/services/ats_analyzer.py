@@ -1,71 +1,198 @@
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import copy
+import hashlib
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Iterable
+from collections import Counter
+from functools import lru_cache
 import logging
+import ahocorasick
+from cachetools import LRUCache
+
+from models.analysis import Issue, Recommendation
+from services.job_description import job_description_digest
+from services.batch import run_batch
 
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    pass  # Already downloaded in requirements setup
+# Lowercase word tokens; inner . ' - and trailing + # are kept so terms like
+# "node.js", "c++" and "c#" survive, while sentence punctuation is dropped
+WORD_PATTERN = re.compile(r"[^\W_](?:[\w+#]|[.'-](?=[^\W_]))*")
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+# A year from 1980 to 2029, or the word "year", marks dated experience
+DATE_MENTION_PATTERN = re.compile(r'\b(?:19[89]\d|20[0-2]\d)\b|year', re.ASCII)
+
+# Weights of each metric in the overall score; unknown metrics weigh 0.25
+OVERALL_SCORE_WEIGHTS = {
+    'format_score': 0.25,
+    'ats_compatibility': 0.25,
+    'keyword_match': 0.30,
+    'sections_score': 0.20
+}
+
+# ATS-friendly formatting rules
+FORMAT_RULES = {
+    'use_standard_fonts': True,
+    'avoid_tables': True,
+    'use_bullet_points': True,
+    'standard_sections': True,
+    'consistent_formatting': True
+}
+
+# Section importance weights for scoring
+SECTION_WEIGHTS = {
+    'contact': 0.10,
+    'summary': 0.15,
+    'experience': 0.40,
+    'education': 0.15,
+    'skills': 0.15,
+    'certifications': 0.05
+}
+
+# Common important keywords for different industries
+INDUSTRY_KEYWORDS = {
+    'technology': frozenset([
+        'software', 'development', 'programming', 'coding', 'algorithm',
+        'database', 'api', 'framework', 'debugging', 'testing',
+        'agile', 'scrum', 'devops', 'cloud', 'architecture'
+    ]),
+    'data_science': frozenset([
+        'machine learning', 'data analysis', 'statistics', 'modeling',
+        'python', 'r', 'sql', 'visualization', 'big data', 'analytics'
+    ]),
+    'marketing': frozenset([
+        'campaign', 'branding', 'social media', 'content', 'analytics',
+        'seo', 'sem', 'conversion', 'engagement', 'strategy'
+    ]),
+    'finance': frozenset([
+        'financial', 'analysis', 'modeling', 'risk', 'compliance',
+        'reporting', 'budgeting', 'forecasting', 'accounting', 'audit'
+    ])
+}
+
+# Fixed issues and recommendations; the models are frozen, so one shared
+# instance serves every analysis
+FORMATTING_ISSUE = Issue(
+    type='warning',
+    category='Formatting',
+    title='Formatting needs improvement',
+    description='Your resume has formatting issues that may affect ATS parsing',
+    suggestions=[
+        'Use standard fonts like Arial or Calibri',
+        'Avoid tables and complex layouts',
+        'Use bullet points for better readability',
+        'Ensure consistent formatting throughout'
+    ]
+)
+
+SKILLS_SECTION_ISSUE = Issue(
+    type='info',
+    category='Structure',
+    title='Add skills section',
+    description='A dedicated skills section can improve ATS parsing',
+    suggestions=[
+        'Create a skills section with relevant technical skills',
+        'Include both hard and soft skills',
+        'Use keywords from the job description'
+    ]
+)
+
+CRITICAL_ISSUES_RECOMMENDATION = Recommendation(
+    priority='high',
+    title='Fix Critical Issues',
+    description='Address formatting and structural problems that significantly impact ATS parsing',
+    impact='+20 points'
+)
+
+QUANTIFY_ACHIEVEMENTS_RECOMMENDATION = Recommendation(
+    priority='medium',
+    title='Quantify Achievements',
+    description='Add specific numbers and percentages to your accomplishments',
+    impact='+10 points'
+)
+
+SECTION_ORDER_RECOMMENDATION = Recommendation(
+    priority='low',
+    title='Optimize Section Order',
+    description='Ensure sections are in a logical order: Contact, Summary, Experience, Education, Skills',
+    impact='+5 points'
+)
+
+# Job description keywords keyed by job_description_digest, shared by all analyzer instances
+jd_keyword_cache = LRUCache(maxsize=256)
+
+@lru_cache(maxsize=1)
+def get_stop_words() -> frozenset:
+    """English stopwords, downloaded if missing and loaded once per process"""
+    import nltk
+    from nltk.corpus import stopwords
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+    return frozenset(stopwords.words('english'))
+
+@lru_cache(maxsize=1)
+def get_keyword_vectorizer() -> TfidfVectorizer:
+    """Vectorizer reused (and refit) for per-sentence keyword scoring"""
+    return TfidfVectorizer(max_features=50, stop_words='english')
+
+@lru_cache(maxsize=1)
+def get_skills_vectorizer() -> HashingVectorizer:
+    """Stateless term hasher for resume/job description similarity, no vocabulary to build"""
+    return HashingVectorizer(n_features=2**18, alternate_sign=False, norm=None, stop_words='english')
+
+def clamp_score(score: float) -> int:
+    """Clamp a score to the 0-100 range as an int"""
+    return 0 if score < 0 else 100 if score > 100 else int(score)
+
+def most_frequent_tokens(tokens: Iterable[str], limit: int = 20) -> List[str]:
+    """Most frequent tokens, ties in first-seen order"""
+    return [token for token, _ in Counter(tokens).most_common(limit)]
+
+@lru_cache(maxsize=1024)
+def build_keyword_automaton(keywords: Tuple[str, ...]) -> ahocorasick.Automaton:
+    """Build an automaton matching every keyword, once per distinct keyword set"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def count_keywords(automaton: ahocorasick.Automaton, text_lower: str) -> Counter:
+    """Count non-overlapping occurrences of each keyword in one pass, like str.count"""
+    counts = Counter()
+    if automaton.kind != ahocorasick.AHOCORASICK:
+        return counts  # No keywords were added
+    next_start = {}
+    for end_index, keyword in automaton.iter(text_lower):
+        start_index = end_index - len(keyword) + 1
+        if start_index >= next_start.get(keyword, 0):
+            counts[keyword] += 1
+            next_start[keyword] = end_index + 1
+    return counts
 
 class ATSAnalyzer:
     def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
-        
-        # ATS-friendly formatting rules
-        self.format_rules = {
-            'use_standard_fonts': True,
-            'avoid_tables': True,
-            'use_bullet_points': True,
-            'standard_sections': True,
-            'consistent_formatting': True
-        }
-        
-        # Section importance weights for scoring
-        self.section_weights = {
-            'contact': 0.10,
-            'summary': 0.15,
-            'experience': 0.40,
-            'education': 0.15,
-            'skills': 0.15,
-            'certifications': 0.05
-        }
-        
-        # Common important keywords for different industries
-        self.industry_keywords = {
-            'technology': [
-                'software', 'development', 'programming', 'coding', 'algorithm',
-                'database', 'api', 'framework', 'debugging', 'testing',
-                'agile', 'scrum', 'devops', 'cloud', 'architecture'
-            ],
-            'data_science': [
-                'machine learning', 'data analysis', 'statistics', 'modeling',
-                'python', 'r', 'sql', 'visualization', 'big data', 'analytics'
-            ],
-            'marketing': [
-                'campaign', 'branding', 'social media', 'content', 'analytics',
-                'seo', 'sem', 'conversion', 'engagement', 'strategy'
-            ],
-            'finance': [
-                'financial', 'analysis', 'modeling', 'risk', 'compliance',
-                'reporting', 'budgeting', 'forecasting', 'accounting', 'audit'
-            ]
-        }
+        # Finished analyses keyed by resume text + job description digests
+        self.analysis_cache = LRUCache(maxsize=128)
     
     def analyze_resume(self, parsed_resume: Dict, job_description: str = None) -> Dict:
         """Main analysis function that returns comprehensive ATS analysis"""
         try:
             resume_text = parsed_resume.get('raw_text', '')
             
+            # The parsed fields all derive from raw_text, so text + job description
+            # identify the result
+            cache_key = (
+                hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).digest(),
+                hashlib.blake2b((job_description or '').encode('utf-8'), digest_size=16).digest()
+            )
+            cached_analysis = self.analysis_cache.get(cache_key)
+            if cached_analysis is not None:
+                return copy.deepcopy(cached_analysis)
+            
             # Core analyses
             format_score = self.analyze_format(parsed_resume)
             ats_compatibility = self.calculate_ats_compatibility(parsed_resume)
@@ -89,7 +216,7 @@ class ATSAnalyzer:
                 'sections_score': sections_analysis.get('overall_score', 70)
             })
             
-            return {
+            analysis = {
                 'overall_score': overall_score,
                 'ats_compatibility': ats_compatibility,
                 'keyword_match': keyword_analysis.get('match_percentage', 50),
@@ -102,10 +229,20 @@ class ATSAnalyzer:
                 'recommendations': recommendations
             }
             
+            self.analysis_cache[cache_key] = copy.deepcopy(analysis)
+            
+            return analysis
+            
         except Exception as e:
-            logger.error(f"Error in ATS analysis: {str(e)}")
+            logger.error("Error in ATS analysis: %s", e)
             raise Exception(f"Analysis failed: {str(e)}")
     
+    def analyze_batch(self, parsed_resumes: List[Dict], job_description: str = None, max_workers: int = None) -> List[Dict]:
+        """Analyze many parsed resumes against one job description in worker processes, results in input order"""
+        return run_batch(
+            analyze_resume_job, parsed_resumes, [job_description] * len(parsed_resumes), max_workers=max_workers
+        )
+    
     def analyze_format(self, parsed_resume: Dict) -> int:
         """Analyze resume formatting for ATS compatibility"""
         score = 100
@@ -132,7 +269,7 @@ class ATSAnalyzer:
         elif word_count > 1000:
             score -= 10
         
-        return max(0, min(100, score))
+        return clamp_score(score)
     
     def calculate_ats_compatibility(self, parsed_resume: Dict) -> int:
         """Calculate how well the resume would perform in ATS systems"""
@@ -156,7 +293,7 @@ class ATSAnalyzer:
         if sections.get('skills', {}).get('present', False):
             score += 10
         
-        return max(0, min(100, score))
+        return clamp_score(score)
     
     def analyze_sections(self, parsed_resume: Dict) -> Dict:
         """Analyze individual resume sections"""
@@ -178,18 +315,16 @@ class ATSAnalyzer:
                 
                 # Special checks for experience section
                 if section_name == 'experience':
-                    if not any('year' in ' '.join(content).lower() or 
-                             any(str(year) in ' '.join(content) for year in range(2010, 2025)) 
-                             for content in [content]):
+                    if not DATE_MENTION_PATTERN.search(' '.join(content).lower()):
                         score -= 15
                         issues.append("Add dates to work experience")
                 
                 section_analysis[section_name] = {
                     'present': True,
-                    'score': max(0, min(100, score)),
+                    'score': clamp_score(score),
                     'issues': issues
                 }
-                total_score += score * self.section_weights.get(section_name, 0.1)
+                total_score += score * SECTION_WEIGHTS.get(section_name, 0.1)
             else:
                 section_analysis[section_name] = {
                     'present': False,
@@ -204,32 +339,46 @@ class ATSAnalyzer:
     
     def analyze_keywords(self, resume_text: str, job_description: str) -> Dict:
         """Analyze keyword matching between resume and job description"""
+        if not resume_text:
+            return self.analyze_keywords_without_jd('')
+        
         try:
-            # Extract keywords from job description
-            jd_keywords = self.extract_keywords(job_description)
-            resume_keywords = self.extract_keywords(resume_text)
+            # Extract keywords from job description; only the top 20 are matched
+            # and the top 5 of those count as high importance
+            jd_keywords = self.extract_jd_keywords(job_description)
+            top_keywords = jd_keywords[:20]
+            high_importance = set(top_keywords[:5])
             
-            # Find matches
-            found_keywords = []
-            missing_keywords = []
+            # Keywords are already lowercase, so each text is lowercased once and
+            # scanned once for all of them
+            automaton = build_keyword_automaton(top_keywords)
+            resume_counts = count_keywords(automaton, resume_text.lower())
+            present = [keyword for keyword in top_keywords if resume_counts[keyword] > 0]
+            absent = [keyword for keyword in top_keywords if resume_counts[keyword] == 0]
+            # The job description is only scanned when something is missing
+            jd_counts = count_keywords(automaton, job_description.lower()) if absent else Counter()
             
-            for keyword in jd_keywords[:20]:  # Top 20 keywords
-                if any(kw.lower() in resume_text.lower() for kw in [keyword]):
-                    found_keywords.append({
-                        'keyword': keyword,
-                        'importance': 'high' if keyword in jd_keywords[:5] else 'medium',
-                        'frequency': resume_text.lower().count(keyword.lower()),
-                        'present': True
-                    })
-                else:
-                    missing_keywords.append({
-                        'keyword': keyword,
-                        'importance': 'high' if keyword in jd_keywords[:5] else 'medium',
-                        'frequency': job_description.lower().count(keyword.lower())
-                    })
+            # Build the output records in one shot per list
+            found_keywords = [
+                {
+                    'keyword': keyword,
+                    'importance': 'high' if keyword in high_importance else 'medium',
+                    'frequency': resume_counts[keyword],
+                    'present': True
+                }
+                for keyword in present
+            ]
+            missing_keywords = [
+                {
+                    'keyword': keyword,
+                    'importance': 'high' if keyword in high_importance else 'medium',
+                    'frequency': jd_counts[keyword]
+                }
+                for keyword in absent
+            ]
             
             # Calculate match percentage
-            match_percentage = (len(found_keywords) / max(len(jd_keywords[:20]), 1)) * 100
+            match_percentage = (len(found_keywords) / max(len(top_keywords), 1)) * 100
             
             return {
                 'match_percentage': int(match_percentage),
@@ -239,7 +388,7 @@ class ATSAnalyzer:
             }
             
         except Exception as e:
-            logger.error(f"Error in keyword analysis: {str(e)}")
+            logger.error("Error in keyword analysis: %s", e)
             return self.analyze_keywords_without_jd(resume_text)
     
     def analyze_keywords_without_jd(self, resume_text: str) -> Dict:
@@ -252,13 +401,15 @@ class ATSAnalyzer:
         
         found_keywords = []
         missing_keywords = []
+        resume_counts = count_keywords(build_keyword_automaton(tuple(general_keywords)), resume_text.lower())
         
         for keyword in general_keywords:
-            if keyword.lower() in resume_text.lower():
+            frequency = resume_counts[keyword]
+            if frequency > 0:
                 found_keywords.append({
                     'keyword': keyword,
                     'importance': 'medium',
-                    'frequency': resume_text.lower().count(keyword.lower()),
+                    'frequency': frequency,
                     'present': True
                 })
             else:
@@ -277,154 +428,129 @@ class ATSAnalyzer:
             'missing_keywords': missing_keywords[:5]  # Limit missing keywords
         }
     
+    def extract_jd_keywords(self, job_description: str) -> Tuple[str, ...]:
+        """Extract job description keywords once per distinct description"""
+        cache_key = job_description_digest(job_description)
+        jd_keywords = jd_keyword_cache.get(cache_key)
+        if jd_keywords is None:
+            jd_keywords = tuple(self.extract_keywords(job_description))
+            jd_keyword_cache[cache_key] = jd_keywords
+        return jd_keywords
+    
     def extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from text"""
         try:
-            # Tokenize and clean
-            tokens = word_tokenize(text.lower())
-            tokens = [token for token in tokens if token.isalnum() and token not in self.stop_words]
-            
             # Use TF-IDF to find important terms
-            sentences = sent_tokenize(text)
+            sentences = SENTENCE_SPLIT_PATTERN.split(text.strip())
             if len(sentences) < 2:
-                # If too few sentences, use simple frequency
-                from collections import Counter
-                word_freq = Counter(tokens)
-                return [word for word, freq in word_freq.most_common(20)]
+                # If too few sentences, use simple frequency over cleaned tokens
+                stop_words = get_stop_words()
+                return most_frequent_tokens(token for token in WORD_PATTERN.findall(text.lower()) if token not in stop_words)
             
-            vectorizer = TfidfVectorizer(max_features=50, stop_words='english')
+            vectorizer = get_keyword_vectorizer()
             tfidf_matrix = vectorizer.fit_transform(sentences)
             feature_names = vectorizer.get_feature_names_out()
             
-            # Get average TF-IDF scores
-            scores = np.mean(tfidf_matrix.toarray(), axis=0)
-            keyword_scores = list(zip(feature_names, scores))
-            keyword_scores.sort(key=lambda x: x[1], reverse=True)
+            # Get average TF-IDF scores straight from the sparse matrix
+            scores = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
+            ranking = np.argsort(-scores, kind='stable')
             
-            return [keyword for keyword, score in keyword_scores if score > 0.1]
+            return [feature_names[i] for i in ranking if scores[i] > 0.1]
             
         except Exception as e:
-            logger.error(f"Error extracting keywords: {str(e)}")
+            logger.error("Error extracting keywords: %s", e)
             # Fallback to simple word frequency
-            from collections import Counter
-            tokens = word_tokenize(text.lower())
-            tokens = [token for token in tokens if token.isalnum() and len(token) > 3]
-            word_freq = Counter(tokens)
-            return [word for word, freq in word_freq.most_common(20)]
+            return most_frequent_tokens(token for token in WORD_PATTERN.findall(text.lower()) if len(token) > 3)
     
     def calculate_skills_match(self, resume_text: str, job_description: str) -> int:
         """Calculate how well skills match between resume and job description"""
+        if not resume_text or not job_description:
+            return 60  # Default score
+        
         try:
-            # Simple cosine similarity between texts
-            vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_description])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            # Cosine similarity between TF-IDF vectors of the two texts
+            term_counts = get_skills_vectorizer().transform([resume_text, job_description])
+            if term_counts.nnz == 0:
+                return 60  # Nothing but stopwords on either side
+            tfidf_matrix = TfidfTransformer(norm=None).fit_transform(term_counts)
+            # One sparse product gives both squared norms and the dot product
+            gram = (tfidf_matrix @ tfidf_matrix.T).toarray()
+            norms = np.sqrt(gram[0, 0] * gram[1, 1])
+            if norms == 0:
+                return 0
+            similarity = gram[0, 1] / norms
             return int(similarity * 100)
         except:
             return 60  # Default score
     
     def calculate_overall_score(self, scores: Dict) -> int:
         """Calculate weighted overall ATS score"""
-        weights = {
-            'format_score': 0.25,
-            'ats_compatibility': 0.25,
-            'keyword_match': 0.30,
-            'sections_score': 0.20
-        }
-        
-        total_score = 0
-        for metric, score in scores.items():
-            weight = weights.get(metric, 0.25)
-            total_score += score * weight
+        total_score = sum(
+            score * OVERALL_SCORE_WEIGHTS.get(metric, 0.25) for metric, score in scores.items()
+        )
         
-        return int(min(100, max(0, total_score)))
+        return clamp_score(total_score)
     
-    def generate_issues(self, parsed_resume: Dict, keyword_analysis: Dict, format_score: int) -> List[Dict]:
+    def generate_issues(self, parsed_resume: Dict, keyword_analysis: Dict, format_score: int) -> List[Issue]:
         """Generate issues based on analysis results"""
         issues = []
         
         # Format issues
         if format_score < 80:
-            issues.append({
-                'type': 'warning',
-                'category': 'Formatting',
-                'title': 'Formatting needs improvement',
-                'description': 'Your resume has formatting issues that may affect ATS parsing',
-                'suggestions': [
-                    'Use standard fonts like Arial or Calibri',
-                    'Avoid tables and complex layouts',
-                    'Use bullet points for better readability',
-                    'Ensure consistent formatting throughout'
-                ]
-            })
+            issues.append(FORMATTING_ISSUE)
         
         # Missing keywords
         missing_kw = keyword_analysis.get('missing_keywords', [])
         if len(missing_kw) > 3:
-            issues.append({
-                'type': 'critical',
-                'category': 'Keywords',
-                'title': 'Missing important keywords',
-                'description': f'Your resume is missing {len(missing_kw)} important keywords',
-                'suggestions': [
+            issues.append(Issue(
+                type='critical',
+                category='Keywords',
+                title='Missing important keywords',
+                description=f'Your resume is missing {len(missing_kw)} important keywords',
+                suggestions=[
                     f'Add "{kw["keyword"]}" to relevant sections' for kw in missing_kw[:3]
                 ]
-            })
+            ))
         
         # Section issues
         sections = parsed_resume.get('sections', {})
         if not sections.get('skills', {}).get('present', False):
-            issues.append({
-                'type': 'info',
-                'category': 'Structure',
-                'title': 'Add skills section',
-                'description': 'A dedicated skills section can improve ATS parsing',
-                'suggestions': [
-                    'Create a skills section with relevant technical skills',
-                    'Include both hard and soft skills',
-                    'Use keywords from the job description'
-                ]
-            })
+            issues.append(SKILLS_SECTION_ISSUE)
         
         return issues
     
-    def generate_recommendations(self, issues: List[Dict], keyword_analysis: Dict) -> List[Dict]:
+    def generate_recommendations(self, issues: List[Issue], keyword_analysis: Dict) -> List[Recommendation]:
         """Generate actionable recommendations"""
         recommendations = []
         
         # High priority recommendations
         missing_kw = keyword_analysis.get('missing_keywords', [])
         if missing_kw:
-            recommendations.append({
-                'priority': 'high',
-                'title': 'Add Missing Keywords',
-                'description': f'Include the top {min(5, len(missing_kw))} missing keywords in relevant sections',
-                'impact': '+15 points'
-            })
+            recommendations.append(Recommendation(
+                priority='high',
+                title='Add Missing Keywords',
+                description=f'Include the top {min(5, len(missing_kw))} missing keywords in relevant sections',
+                impact='+15 points'
+            ))
         
         # Format recommendations
-        critical_issues = [issue for issue in issues if issue['type'] == 'critical']
-        if critical_issues:
-            recommendations.append({
-                'priority': 'high',
-                'title': 'Fix Critical Issues',
-                'description': 'Address formatting and structural problems that significantly impact ATS parsing',
-                'impact': '+20 points'
-            })
+        if any(issue.type == 'critical' for issue in issues):
+            recommendations.append(CRITICAL_ISSUES_RECOMMENDATION)
         
         # General improvements
-        recommendations.append({
-            'priority': 'medium',
-            'title': 'Quantify Achievements',
-            'description': 'Add specific numbers and percentages to your accomplishments',
-            'impact': '+10 points'
-        })
+        recommendations.append(QUANTIFY_ACHIEVEMENTS_RECOMMENDATION)
+        recommendations.append(SECTION_ORDER_RECOMMENDATION)
         
-        recommendations.append({
-            'priority': 'low',
-            'title': 'Optimize Section Order',
-            'description': 'Ensure sections are in a logical order: Contact, Summary, Experience, Education, Skills',
-            'impact': '+5 points'
-        })
-        
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+@lru_cache(maxsize=1)
+def get_batch_analyzer() -> ATSAnalyzer:
+    """Analyzer built once per worker process for analyze_batch"""
+    return ATSAnalyzer()
+
+def analyze_resume_job(parsed_resume: Dict, job_description: str = None) -> Dict:
+    """Analyze one resume for analyze_batch; a failure becomes an error entry so the rest of the batch completes"""
+    try:
+        return get_batch_analyzer().analyze_resume(parsed_resume, job_description)
+    except Exception as e:
+        return {'error': str(e)}
\ No newline at end of file
@@ -1,10 +1,211 @@
+"""ATS scoring engine.
+
+Scoring time goes almost entirely to scanning resume and job description text
+(keyword automaton passes, lowercasing, word regexes); the score arithmetic is
+negligible. Optimizations here cut passes over the text and reuse their results
+rather than vectorizing arithmetic.
+"""
 from typing import Dict, List, Tuple
 import re
+import copy
+import json
+import hashlib
 from collections import Counter
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 import logging
+import numpy as np
+import ahocorasick
+from cachetools import LRUCache
+
+from services.batch import run_batch
+
 
 logger = logging.getLogger(__name__)
 
+JOB_WORD_PATTERN = re.compile(r'\b[a-z]{4,}\b')
+
+# Filler words never reported as job keywords
+COMMON_WORDS = frozenset([
+    'the', 'and', 'for', 'with', 'you', 'will', 'our', 'this', 'that', 'are', 'have', 'been', 'work'
+])
+
+# Technical skills (high importance)
+TECH_SKILLS = (
+    'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
+    'kubernetes', 'git', 'mongodb', 'postgresql', 'html', 'css', 'typescript'
+)
+
+# Job-specific terms (high importance)
+JOB_TERMS = (
+    'experience', 'years', 'senior', 'junior', 'lead', 'manager', 'director',
+    'bachelor', 'master', 'degree', 'certification', 'agile', 'scrum'
+)
+
+# Soft skills (medium importance)
+SOFT_SKILLS = (
+    'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
+    'creative', 'organized', 'detail-oriented', 'time management'
+)
+
+# Industry terms (medium importance)
+INDUSTRY_TERMS = (
+    'development', 'engineering', 'marketing', 'sales', 'finance', 'healthcare',
+    'consulting', 'operations', 'strategy', 'business'
+)
+
+# Job title words that identify an industry, earlier industries win ties
+INDUSTRY_TRIGGERS = (
+    ('technology', ('engineer', 'developer', 'programmer', 'software', 'tech')),
+    ('marketing', ('marketing', 'brand', 'digital', 'content')),
+    ('finance', ('finance', 'financial', 'accounting', 'analyst')),
+    ('healthcare', ('nurse', 'doctor', 'medical', 'healthcare')),
+    ('sales', ('sales', 'account', 'business development'))
+)
+
+# Strength messages by component and minimum score, highest threshold first
+STRENGTH_RULES = (
+    ('keywords_skills', 80, "✅ Excellent keyword optimization and skills alignment"),
+    ('keywords_skills', 60, "✅ Good technical and soft skills representation"),
+    ('formatting_structure', 80, "✅ ATS-friendly formatting and structure"),
+    ('work_experience', 80, "✅ Strong quantified achievements and action verbs"),
+    ('work_experience', 60, "✅ Good work experience presentation"),
+    ('education_certifications', 80, "✅ Comprehensive education and certifications"),
+    ('readability_grammar', 80, "✅ Excellent readability and grammar")
+)
+
+# Weakness messages by component and the score they apply below
+WEAKNESS_RULES = (
+    ('keywords_skills', 50, "❌ Limited keyword optimization - add more relevant skills"),
+    ('formatting_structure', 50, "❌ Poor ATS formatting - avoid tables, images, and complex layouts"),
+    ('work_experience', 50, "❌ Weak work experience section - add quantified achievements"),
+    ('education_certifications', 40, "❌ Missing education details - add degrees and certifications"),
+    ('readability_grammar', 50, "❌ Poor readability - improve sentence structure and grammar")
+)
+
+# Suggestions by component and the score they apply below
+SUGGESTION_RULES = (
+    ('keywords_skills', 70, {
+        'title': 'Improve Keyword Optimization',
+        'description': 'Add more relevant technical and soft skills matching the job requirements',
+        'impact': '+15-20 points',
+        'priority': 'high'
+    }),
+    ('formatting_structure', 70, {
+        'title': 'Fix Formatting Issues',
+        'description': 'Remove tables, images, and use ATS-friendly fonts (Arial, Calibri)',
+        'impact': '+10-15 points',
+        'priority': 'high'
+    }),
+    ('work_experience', 70, {
+        'title': 'Quantify Achievements',
+        'description': 'Add specific numbers, percentages, and metrics to demonstrate impact',
+        'impact': '+12-18 points',
+        'priority': 'high'
+    }),
+    ('education_certifications', 60, {
+        'title': 'Add Education Details',
+        'description': 'Include degrees, institutions, and relevant certifications',
+        'impact': '+8-12 points',
+        'priority': 'medium'
+    }),
+    ('readability_grammar', 60, {
+        'title': 'Improve Readability',
+        'description': 'Use shorter sentences, fix grammar issues, and improve flow',
+        'impact': '+5-10 points',
+        'priority': 'medium'
+    })
+)
+
+# Match weight of a job keyword by importance
+IMPORTANCE_WEIGHTS = {'high': 3, 'medium': 2, 'low': 1}
+
+# Score ladders: the points at index i apply from thresholds[i-1] up to thresholds[i]
+SKILLS_THRESHOLDS = (3, 5, 10, 15)
+SKILLS_SCORES = (25, 45, 60, 75, 90)
+QUANTIFIED_THRESHOLDS = (1, 3, 5)
+QUANTIFIED_POINTS = (0, 10, 20, 25)
+ACTION_VERB_THRESHOLDS = (3, 5, 10)
+ACTION_VERB_POINTS = (0, 10, 15, 20)
+FLESCH_THRESHOLDS = (30, 60)
+FLESCH_POINTS = (10, 20, 30)
+
+# Score bands: a value on a lower bound counts toward the band above it, on an upper bound toward the band below
+WORD_COUNT_LOWER = (150, 200, 300)
+WORD_COUNT_UPPER = (800, 1200)
+WORD_COUNT_POINTS = (0, 10, 15, 20, 15, 10)
+SENTENCE_LENGTH_LOWER = (10, 15)
+SENTENCE_LENGTH_UPPER = (25, 35)
+SENTENCE_LENGTH_POINTS = (0, 5, 10, 5, 0)
+
+# Parsed resume fields the job-independent scorers read
+RESUME_SCORE_FIELDS = (
+    'formatting_info', 'sections', 'contact_info', 'work_experience',
+    'education', 'certifications', 'readability', 'grammar_issues'
+)
+
+HIGH_IMPORTANCE_KEYWORDS = TECH_SKILLS + JOB_TERMS
+MEDIUM_IMPORTANCE_KEYWORDS = SOFT_SKILLS + INDUSTRY_TERMS
+
+@lru_cache(maxsize=1024)
+def build_keyword_automaton(keywords: Tuple[str, ...]) -> ahocorasick.Automaton:
+    """Build an automaton matching every keyword, once per distinct keyword set"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+def build_industry_trigger_automaton() -> ahocorasick.Automaton:
+    """Build an automaton mapping title words to the rank of their industry"""
+    automaton = ahocorasick.Automaton()
+    for rank, (_, triggers) in enumerate(INDUSTRY_TRIGGERS):
+        for trigger in triggers:
+            automaton.add_word(trigger, rank)
+    automaton.make_automaton()
+    return automaton
+
+def ladder_score(value: float, thresholds: Tuple, scores: Tuple):
+    """Look up the score of the highest threshold reached"""
+    return scores[bisect_right(thresholds, value)]
+
+def band_score(value: float, lower: Tuple, upper: Tuple, scores: Tuple):
+    """Look up the score of the band containing value, bands closed on the inside"""
+    return scores[bisect_right(lower, value) + bisect_left(upper, value)]
+
+def find_keywords(automaton: ahocorasick.Automaton, text_lower: str) -> set:
+    """Return the keywords occurring anywhere in the text, in one pass"""
+    if automaton.kind != ahocorasick.AHOCORASICK:
+        return set()  # No keywords were added
+    return {keyword for _, keyword in automaton.iter(text_lower)}
+
+# Skills and terms looked for in job descriptions
+JOB_SKILL_AUTOMATON = build_keyword_automaton(HIGH_IMPORTANCE_KEYWORDS + MEDIUM_IMPORTANCE_KEYWORDS)
+
+@lru_cache(maxsize=256)
+def cached_job_keywords(job_description: str) -> Tuple[Tuple[str, str], ...]:
+    """Extract keywords from job description with importance ratings, once per job description"""
+    # perf: one automaton pass and one regex pass over the job description
+    text_lower = job_description.lower()
+    
+    # Find every skill and term in a single pass, then report them in list order
+    present = find_keywords(JOB_SKILL_AUTOMATON, text_lower)
+    high_importance = [(skill, 'high') for skill in HIGH_IMPORTANCE_KEYWORDS if skill in present]
+    medium_importance = [(skill, 'medium') for skill in MEDIUM_IMPORTANCE_KEYWORDS if skill in present]
+    
+    # Extract other important words (low importance)
+    words = JOB_WORD_PATTERN.findall(text_lower)
+    word_freq = Counter(words)
+    seen_keywords = {keyword for keyword, _ in high_importance + medium_importance}
+    
+    low_importance = []
+    for word, freq in word_freq.most_common(20):
+        if word not in COMMON_WORDS and len(word) > 3:
+            if word not in seen_keywords:
+                low_importance.append((word, 'low'))
+    
+    return tuple(high_importance + medium_importance + low_importance[:10])
+
 class ATSScoringEngine:
     def __init__(self):
         # Weight distribution as per requirements
@@ -18,38 +219,53 @@ class ATSScoringEngine:
         
         # Industry-specific keywords
         self.industry_keywords = {
-            'technology': [
+            'technology': frozenset([
                 'software', 'development', 'programming', 'coding', 'algorithm',
                 'database', 'api', 'framework', 'debugging', 'testing',
                 'agile', 'scrum', 'devops', 'cloud', 'architecture'
-            ],
-            'marketing': [
+            ]),
+            'marketing': frozenset([
                 'campaign', 'branding', 'social media', 'content', 'analytics',
                 'seo', 'sem', 'conversion', 'engagement', 'strategy'
-            ],
-            'finance': [
+            ]),
+            'finance': frozenset([
                 'financial', 'analysis', 'modeling', 'risk', 'compliance',
                 'reporting', 'budgeting', 'forecasting', 'accounting', 'audit'
-            ],
-            'healthcare': [
+            ]),
+            'healthcare': frozenset([
                 'patient', 'clinical', 'medical', 'healthcare', 'treatment',
                 'diagnosis', 'therapy', 'nursing', 'hospital', 'care'
-            ],
-            'sales': [
+            ]),
+            'sales': frozenset([
                 'sales', 'revenue', 'client', 'customer', 'relationship',
                 'negotiation', 'pipeline', 'quota', 'territory', 'crm'
-            ]
+            ])
         }
+        
+        # One automaton over every industry's keywords, so a resume is scanned once
+        # whichever industry it is scored against
+        self.industry_automaton = build_keyword_automaton(
+            tuple(sorted(frozenset().union(*self.industry_keywords.values())))
+        )
+        
+        # Industry keywords found per lowercased resume text
+        self.industry_hits_cache = LRUCache(maxsize=256)
+        
+        # Job title trigger words of every industry, matched in one pass
+        self.industry_trigger_automaton = build_industry_trigger_automaton()
+        
+        # Job-independent component scores keyed by a digest of the fields they read
+        self.component_cache = LRUCache(maxsize=256)
 
     def calculate_comprehensive_score(self, parsed_resume: Dict, job_description: str = None, job_title: str = None) -> Dict:
         """Calculate comprehensive ATS score"""
         
+        # Keyword matching feeds both the keywords score and the job match analysis
+        match_analysis = self.analyze_keyword_match(self.lowercase_text(parsed_resume), job_description) if job_description else None
+        
         # Individual component scores
-        keywords_score = self.calculate_keywords_skills_score(parsed_resume, job_description, job_title)
-        formatting_score = self.calculate_formatting_structure_score(parsed_resume)
-        experience_score = self.calculate_work_experience_score(parsed_resume)
-        education_score = self.calculate_education_certifications_score(parsed_resume)
-        readability_score = self.calculate_readability_grammar_score(parsed_resume)
+        keywords_score = self.calculate_keywords_skills_score(parsed_resume, job_description, job_title, match_analysis)
+        formatting_score, experience_score, education_score, readability_score = self.calculate_resume_component_scores(parsed_resume)
         
         # Calculate weighted overall score
         overall_score = (
@@ -60,28 +276,57 @@ class ATSScoringEngine:
             readability_score['score'] * self.score_weights['readability_grammar']
         )
         
+        component_scores = {
+            'keywords_skills': keywords_score,
+            'formatting_structure': formatting_score,
+            'work_experience': experience_score,
+            'education_certifications': education_score,
+            'readability_grammar': readability_score
+        }
+        
         # Generate comprehensive analysis
         analysis = {
             'overall_score': int(overall_score),
-            'component_scores': {
-                'keywords_skills': keywords_score,
-                'formatting_structure': formatting_score,
-                'work_experience': experience_score,
-                'education_certifications': education_score,
-                'readability_grammar': readability_score
-            },
-            'strengths': self.identify_strengths(keywords_score, formatting_score, experience_score, education_score, readability_score),
-            'weaknesses': self.identify_weaknesses(keywords_score, formatting_score, experience_score, education_score, readability_score),
-            'suggestions': self.generate_suggestions(keywords_score, formatting_score, experience_score, education_score, readability_score),
-            'job_match_analysis': self.analyze_job_match(parsed_resume, job_description, job_title) if job_description else None
+            'component_scores': component_scores,
+            'strengths': self.identify_strengths(component_scores),
+            'weaknesses': self.identify_weaknesses(component_scores),
+            'suggestions': self.generate_suggestions(component_scores),
+            'job_match_analysis': self.analyze_job_match(parsed_resume, job_description, job_title, match_analysis) if job_description else None
         }
         
         return analysis
 
-    def calculate_keywords_skills_score(self, parsed_resume: Dict, job_description: str = None, job_title: str = None) -> Dict:
-        """Calculate Keywords & Skills Match Score (40% weight)"""
+    def score_batch(self, parsed_resumes: List[Dict], job_description: str = None, job_title: str = None, max_workers: int = None) -> List[Dict]:
+        """Score many parsed resumes against one job in worker processes, results in input order"""
+        return run_batch(
+            score_resume_job, parsed_resumes,
+            [job_description] * len(parsed_resumes), [job_title] * len(parsed_resumes),
+            max_workers=max_workers
+        )
+
+    def calculate_resume_component_scores(self, parsed_resume: Dict) -> Tuple[Dict, Dict, Dict, Dict]:
+        """Calculate the job-independent component scores, reusing them across job descriptions"""
+        resume_fields = {field: parsed_resume[field] for field in RESUME_SCORE_FIELDS if field in parsed_resume}
+        cache_key = hashlib.blake2b(
+            json.dumps(resume_fields, sort_keys=True, default=str).encode('utf-8'), digest_size=16
+        ).digest()
+        
+        scores = self.component_cache.get(cache_key)
+        if scores is None:
+            scores = (
+                self.calculate_formatting_structure_score(parsed_resume),
+                self.calculate_work_experience_score(parsed_resume),
+                self.calculate_education_certifications_score(parsed_resume),
+                self.calculate_readability_grammar_score(parsed_resume)
+            )
+            self.component_cache[cache_key] = scores
+        
+        # Callers get their own copy so cached details stay untouched
+        return copy.deepcopy(scores)
+
+    def calculate_keywords_skills_score(self, parsed_resume: Dict, job_description: str = None, job_title: str = None, match_analysis: Dict = None) -> Dict:
+        """Calculate Keywords & Skills Match Score (40% weight), reusing match_analysis when given"""
         skills_data = parsed_resume.get('skills', {})
-        text = parsed_resume.get('raw_text', '').lower()
         
         base_score = 0
         details = {}
@@ -92,16 +337,7 @@ class ATSScoringEngine:
         total_skills = tech_skills_count + soft_skills_count
         
         # Score based on skills diversity and count
-        if total_skills >= 15:
-            base_score = 90
-        elif total_skills >= 10:
-            base_score = 75
-        elif total_skills >= 5:
-            base_score = 60
-        elif total_skills >= 3:
-            base_score = 45
-        else:
-            base_score = 25
+        base_score = ladder_score(total_skills, SKILLS_THRESHOLDS, SKILLS_SCORES)
         
         details['total_skills_found'] = total_skills
         details['technical_skills'] = tech_skills_count
@@ -109,7 +345,8 @@ class ATSScoringEngine:
         
         # Job description matching
         if job_description:
-            match_analysis = self.analyze_keyword_match(text, job_description)
+            if match_analysis is None:
+                match_analysis = self.analyze_keyword_match(self.lowercase_text(parsed_resume), job_description)
             
             # Adjust score based on job description match
             match_percentage = match_analysis['match_percentage']
@@ -126,7 +363,7 @@ class ATSScoringEngine:
         
         # Industry relevance (if job title provided)
         if job_title:
-            industry_score = self.calculate_industry_relevance(text, job_title)
+            industry_score = self.calculate_industry_relevance(self.lowercase_text(parsed_resume), job_title)
             base_score = (base_score + industry_score) / 2
             details['industry_relevance'] = industry_score
         
@@ -212,37 +449,30 @@ class ATSScoringEngine:
         
         # Quantified achievements (25 points)
         quantified = work_exp.get('quantified_achievements', 0)
-        if quantified >= 5:
-            score += 25
-        elif quantified >= 3:
-            score += 20
-        elif quantified >= 1:
-            score += 10
+        score += ladder_score(quantified, QUANTIFIED_THRESHOLDS, QUANTIFIED_POINTS)
         details['quantified_achievements'] = quantified
         
         # Action verbs usage (20 points)
         action_verbs = work_exp.get('action_verbs_count', 0)
-        if action_verbs >= 10:
-            score += 20
-        elif action_verbs >= 5:
-            score += 15
-        elif action_verbs >= 3:
-            score += 10
+        score += ladder_score(action_verbs, ACTION_VERB_THRESHOLDS, ACTION_VERB_POINTS)
         details['action_verbs_count'] = action_verbs
         
         # Chronological order (10 points)
-        if work_exp.get('is_reverse_chronological', False):
+        is_reverse_chronological = work_exp.get('is_reverse_chronological', False)
+        if is_reverse_chronological:
             score += 10
-        details['chronological_order'] = work_exp.get('is_reverse_chronological', False)
+        details['chronological_order'] = is_reverse_chronological
         
         # Job titles and company indicators (5 points)
-        if work_exp.get('job_titles_found') and len(work_exp['job_titles_found']) > 0:
+        job_titles = work_exp.get('job_titles_found', [])
+        company_indicators = work_exp.get('company_indicators', 0)
+        if job_titles:
             score += 3
-        if work_exp.get('company_indicators', 0) > 0:
+        if company_indicators > 0:
             score += 2
         
-        details['job_titles'] = len(work_exp.get('job_titles_found', []))
-        details['company_mentions'] = work_exp.get('company_indicators', 0)
+        details['job_titles'] = len(job_titles)
+        details['company_mentions'] = company_indicators
         
         return {
             'score': min(100, int(score)),
@@ -263,9 +493,10 @@ class ATSScoringEngine:
         if sections.get('education', {}).get('found', False):
             score += 40
             
-            if education.get('degrees_found'):
+            degrees = education.get('degrees_found')
+            if degrees:
                 score += 15
-                details['degrees'] = len(education['degrees_found'])
+                details['degrees'] = len(degrees)
             
             if education.get('institutions_mentioned'):
                 score += 5
@@ -297,24 +528,15 @@ class ATSScoringEngine:
         
         # Readability score (50 points)
         flesch_score = readability.get('flesch_reading_ease', 50)
-        if flesch_score >= 60:  # Easy to read
-            score += 30
-        elif flesch_score >= 30:  # Moderately difficult
-            score += 20
-        else:  # Difficult
-            score += 10
+        # Difficult, moderately difficult, easy to read
+        score += ladder_score(flesch_score, FLESCH_THRESHOLDS, FLESCH_POINTS)
         
         details['readability_score'] = flesch_score
         details['reading_level'] = readability.get('flesch_grade_level', 8)
         
         # Word count appropriateness (20 points)
         word_count = readability.get('word_count', 0)
-        if 300 <= word_count <= 800:
-            score += 20
-        elif 200 <= word_count < 300 or 800 < word_count <= 1200:
-            score += 15
-        elif word_count >= 150:
-            score += 10
+        score += band_score(word_count, WORD_COUNT_LOWER, WORD_COUNT_UPPER, WORD_COUNT_POINTS)
         
         details['word_count'] = word_count
         
@@ -324,10 +546,7 @@ class ATSScoringEngine:
         
         # Sentence length
         avg_sentence_length = readability.get('avg_sentence_length', 15)
-        if 15 <= avg_sentence_length <= 25:
-            score += 10
-        elif 10 <= avg_sentence_length < 15 or 25 < avg_sentence_length <= 35:
-            score += 5
+        score += band_score(avg_sentence_length, SENTENCE_LENGTH_LOWER, SENTENCE_LENGTH_UPPER, SENTENCE_LENGTH_POINTS)
         
         details['avg_sentence_length'] = avg_sentence_length
         
@@ -337,26 +556,41 @@ class ATSScoringEngine:
             'category': 'Readability & Grammar'
         }
 
+    def lowercase_text(self, parsed_resume: Dict) -> str:
+        """Return the lowercased resume text, lowering it once per parsed resume"""
+        raw_text = parsed_resume.get('raw_text', '')
+        cached = parsed_resume.get('_raw_lower')
+        if cached is None or cached[0] is not raw_text:
+            cached = (raw_text, raw_text.lower())
+            parsed_resume['_raw_lower'] = cached
+        return cached[1]
+
     def analyze_keyword_match(self, resume_text: str, job_description: str) -> Dict:
-        """Analyze keyword matching between resume and job description"""
+        """Analyze keyword matching between lowercased resume text and job description"""
+        # perf: one automaton pass over the resume, O(len(resume) + matches)
         # Extract important keywords from job description
         job_keywords = self.extract_job_keywords(job_description)
         
         found_keywords = []
         missing_keywords = []
         
-        resume_lower = resume_text.lower()
+        # Find every job keyword in a single pass over the resume
+        automaton = build_keyword_automaton(tuple(keyword for keyword, _ in job_keywords))
+        present = find_keywords(automaton, resume_text)
         
+        # Accumulate both match weights while splitting found from missing
+        total_weight = 0
+        found_weight = 0
         for keyword, importance in job_keywords:
-            if keyword.lower() in resume_lower:
+            weight = IMPORTANCE_WEIGHTS[importance]
+            total_weight += weight
+            if keyword in present:
                 found_keywords.append({'keyword': keyword, 'importance': importance})
+                found_weight += weight
             else:
                 missing_keywords.append({'keyword': keyword, 'importance': importance})
         
         # Calculate match percentage
-        total_weight = sum(3 if imp == 'high' else 2 if imp == 'medium' else 1 for _, imp in job_keywords)
-        found_weight = sum(3 if kw['importance'] == 'high' else 2 if kw['importance'] == 'medium' else 1 for kw in found_keywords)
-        
         match_percentage = (found_weight / max(total_weight, 1)) * 100
         
         return {
@@ -366,59 +600,37 @@ class ATSScoringEngine:
             'total_keywords_analyzed': len(job_keywords)
         }
 
+    def analyze_keyword_match_batch(self, resume_texts: List[str], job_description: str) -> List[Dict]:
+        """Analyze keyword matching of many resumes against one job description"""
+        job_keywords = self.extract_job_keywords(job_description)
+        keywords = tuple(keyword for keyword, _ in job_keywords)
+        automaton = build_keyword_automaton(keywords)
+        
+        # One presence row per resume; weighted match sums come from a single product
+        presence = np.zeros((len(resume_texts), len(keywords)), dtype=bool)
+        for row, resume_text in enumerate(resume_texts):
+            present = find_keywords(automaton, resume_text.lower())
+            presence[row] = [keyword in present for keyword in keywords]
+        
+        weights = np.array([IMPORTANCE_WEIGHTS[imp] for _, imp in job_keywords], dtype=np.int64)
+        match_percentages = (presence @ weights) / max(int(weights.sum()), 1) * 100
+        
+        results = []
+        for row, match_percentage in zip(presence, match_percentages.tolist()):
+            found_keywords = [{'keyword': keyword, 'importance': importance} for (keyword, importance), found in zip(job_keywords, row) if found]
+            missing_keywords = [{'keyword': keyword, 'importance': importance} for (keyword, importance), found in zip(job_keywords, row) if not found]
+            results.append({
+                'match_percentage': match_percentage,
+                'found_keywords': found_keywords[:15],  # Top 15
+                'missing_keywords': missing_keywords[:10],  # Top 10 missing
+                'total_keywords_analyzed': len(job_keywords)
+            })
+        
+        return results
+
     def extract_job_keywords(self, job_description: str) -> List[Tuple[str, str]]:
         """Extract keywords from job description with importance ratings"""
-        text_lower = job_description.lower()
-        
-        # High importance keywords
-        high_importance = []
-        medium_importance = []
-        low_importance = []
-        
-        # Technical skills (high importance)
-        tech_skills = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
-            'kubernetes', 'git', 'mongodb', 'postgresql', 'html', 'css', 'typescript'
-        ]
-        
-        # Job-specific terms (high importance)
-        job_terms = [
-            'experience', 'years', 'senior', 'junior', 'lead', 'manager', 'director',
-            'bachelor', 'master', 'degree', 'certification', 'agile', 'scrum'
-        ]
-        
-        # Soft skills (medium importance)
-        soft_skills = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'analytical',
-            'creative', 'organized', 'detail-oriented', 'time management'
-        ]
-        
-        # Industry terms (medium importance)
-        industry_terms = [
-            'development', 'engineering', 'marketing', 'sales', 'finance', 'healthcare',
-            'consulting', 'operations', 'strategy', 'business'
-        ]
-        
-        # Check for keywords in job description
-        for skill in tech_skills + job_terms:
-            if skill in text_lower:
-                high_importance.append((skill, 'high'))
-        
-        for skill in soft_skills + industry_terms:
-            if skill in text_lower:
-                medium_importance.append((skill, 'medium'))
-        
-        # Extract other important words (low importance)
-        words = re.findall(r'\b[a-z]{4,}\b', text_lower)
-        word_freq = Counter(words)
-        common_words = ['the', 'and', 'for', 'with', 'you', 'will', 'our', 'this', 'that', 'are', 'have', 'been', 'work']
-        
-        for word, freq in word_freq.most_common(20):
-            if word not in common_words and len(word) > 3:
-                if not any(word in [kw[0] for kw in high_importance + medium_importance]):
-                    low_importance.append((word, 'low'))
-        
-        return high_importance + medium_importance + low_importance[:10]
+        return list(cached_job_keywords(job_description))
 
     def calculate_industry_relevance(self, resume_text: str, job_title: str) -> int:
         """Calculate industry relevance score"""
@@ -427,133 +639,70 @@ class ATSScoringEngine:
         
         if industry and industry in self.industry_keywords:
             keywords = self.industry_keywords[industry]
-            found_keywords = sum(1 for keyword in keywords if keyword in resume_text)
+            found_keywords = len(keywords & self.find_industry_keywords(resume_text))
             relevance_score = (found_keywords / len(keywords)) * 100
             return int(relevance_score)
         
         return 50  # Default score if industry can't be determined
 
+    def find_industry_keywords(self, resume_text: str) -> frozenset:
+        """Return the industry keywords in lowercased resume text, scanning each text once"""
+        # perf: one automaton pass per distinct resume text, then set intersections
+        found = self.industry_hits_cache.get(resume_text)
+        if found is None:
+            found = frozenset(find_keywords(self.industry_automaton, resume_text))
+            self.industry_hits_cache[resume_text] = found
+        return found
+
     def detect_industry(self, job_title: str) -> str:
         """Detect industry from job title"""
         title_lower = job_title.lower()
         
-        if any(word in title_lower for word in ['engineer', 'developer', 'programmer', 'software', 'tech']):
-            return 'technology'
-        elif any(word in title_lower for word in ['marketing', 'brand', 'digital', 'content']):
-            return 'marketing'
-        elif any(word in title_lower for word in ['finance', 'financial', 'accounting', 'analyst']):
-            return 'finance'
-        elif any(word in title_lower for word in ['nurse', 'doctor', 'medical', 'healthcare']):
-            return 'healthcare'
-        elif any(word in title_lower for word in ['sales', 'account', 'business development']):
-            return 'sales'
+        ranks = [rank for _, rank in self.industry_trigger_automaton.iter(title_lower)]
+        if ranks:
+            return INDUSTRY_TRIGGERS[min(ranks)][0]
         
         return None
 
-    def identify_strengths(self, keywords_score, formatting_score, experience_score, education_score, readability_score) -> List[str]:
+    def identify_strengths(self, component_scores: Dict) -> List[str]:
         """Identify resume strengths"""
         strengths = []
+        matched = set()
         
-        if keywords_score['score'] >= 80:
-            strengths.append("✅ Excellent keyword optimization and skills alignment")
-        elif keywords_score['score'] >= 60:
-            strengths.append("✅ Good technical and soft skills representation")
-        
-        if formatting_score['score'] >= 80:
-            strengths.append("✅ ATS-friendly formatting and structure")
-        
-        if experience_score['score'] >= 80:
-            strengths.append("✅ Strong quantified achievements and action verbs")
-        elif experience_score['score'] >= 60:
-            strengths.append("✅ Good work experience presentation")
-        
-        if education_score['score'] >= 80:
-            strengths.append("✅ Comprehensive education and certifications")
-        
-        if readability_score['score'] >= 80:
-            strengths.append("✅ Excellent readability and grammar")
+        # Only the first (highest) strength reached per component is reported
+        for component, threshold, message in STRENGTH_RULES:
+            if component not in matched and component_scores[component]['score'] >= threshold:
+                strengths.append(message)
+                matched.add(component)
         
         return strengths
 
-    def identify_weaknesses(self, keywords_score, formatting_score, experience_score, education_score, readability_score) -> List[str]:
+    def identify_weaknesses(self, component_scores: Dict) -> List[str]:
         """Identify resume weaknesses"""
-        weaknesses = []
-        
-        if keywords_score['score'] < 50:
-            weaknesses.append("❌ Limited keyword optimization - add more relevant skills")
-        
-        if formatting_score['score'] < 50:
-            weaknesses.append("❌ Poor ATS formatting - avoid tables, images, and complex layouts")
-        
-        if experience_score['score'] < 50:
-            weaknesses.append("❌ Weak work experience section - add quantified achievements")
-        
-        if education_score['score'] < 40:
-            weaknesses.append("❌ Missing education details - add degrees and certifications")
-        
-        if readability_score['score'] < 50:
-            weaknesses.append("❌ Poor readability - improve sentence structure and grammar")
-        
-        return weaknesses
+        return [
+            message for component, threshold, message in WEAKNESS_RULES
+            if component_scores[component]['score'] < threshold
+        ]
 
-    def generate_suggestions(self, keywords_score, formatting_score, experience_score, education_score, readability_score) -> List[Dict]:
+    def generate_suggestions(self, component_scores: Dict) -> List[Dict]:
         """Generate actionable suggestions"""
-        suggestions = []
-        
-        if keywords_score['score'] < 70:
-            suggestions.append({
-                'title': 'Improve Keyword Optimization',
-                'description': 'Add more relevant technical and soft skills matching the job requirements',
-                'impact': '+15-20 points',
-                'priority': 'high'
-            })
-        
-        if formatting_score['score'] < 70:
-            suggestions.append({
-                'title': 'Fix Formatting Issues',
-                'description': 'Remove tables, images, and use ATS-friendly fonts (Arial, Calibri)',
-                'impact': '+10-15 points',
-                'priority': 'high'
-            })
-        
-        if experience_score['score'] < 70:
-            suggestions.append({
-                'title': 'Quantify Achievements',
-                'description': 'Add specific numbers, percentages, and metrics to demonstrate impact',
-                'impact': '+12-18 points',
-                'priority': 'high'
-            })
-        
-        if education_score['score'] < 60:
-            suggestions.append({
-                'title': 'Add Education Details',
-                'description': 'Include degrees, institutions, and relevant certifications',
-                'impact': '+8-12 points',
-                'priority': 'medium'
-            })
-        
-        if readability_score['score'] < 60:
-            suggestions.append({
-                'title': 'Improve Readability',
-                'description': 'Use shorter sentences, fix grammar issues, and improve flow',
-                'impact': '+5-10 points',
-                'priority': 'medium'
-            })
-        
-        return suggestions
+        return [
+            dict(suggestion) for component, threshold, suggestion in SUGGESTION_RULES
+            if component_scores[component]['score'] < threshold
+        ]
 
-    def analyze_job_match(self, parsed_resume: Dict, job_description: str, job_title: str = None) -> Dict:
-        """Analyze how well the resume matches the job requirements"""
+    def analyze_job_match(self, parsed_resume: Dict, job_description: str, job_title: str = None, keyword_match: Dict = None) -> Dict:
+        """Analyze how well the resume matches the job requirements, reusing keyword_match when given"""
         if not job_description:
             return None
         
-        text = parsed_resume.get('raw_text', '').lower()
-        keyword_match = self.analyze_keyword_match(text, job_description)
+        if keyword_match is None:
+            keyword_match = self.analyze_keyword_match(self.lowercase_text(parsed_resume), job_description)
         
         # Industry relevance
         industry_match = 50
         if job_title:
-            industry_match = self.calculate_industry_relevance(text, job_title)
+            industry_match = self.calculate_industry_relevance(self.lowercase_text(parsed_resume), job_title)
         
         # Overall job match score
         job_match_score = (keyword_match['match_percentage'] + industry_match) / 2
@@ -565,4 +714,16 @@ class ATSScoringEngine:
             'matched_requirements': len(keyword_match['found_keywords']),
             'missing_requirements': len(keyword_match['missing_keywords']),
             'top_missing_keywords': [kw['keyword'] for kw in keyword_match['missing_keywords'][:5]]
-        }
\ No newline at end of file
+        }
+
+@lru_cache(maxsize=1)
+def get_batch_engine() -> ATSScoringEngine:
+    """Scoring engine built on first use in each score_batch worker"""
+    return ATSScoringEngine()
+
+def score_resume_job(parsed_resume: Dict, job_description: str = None, job_title: str = None) -> Dict:
+    """Score one resume for score_batch, reporting a failure as an error entry"""
+    try:
+        return get_batch_engine().calculate_comprehensive_score(parsed_resume, job_description, job_title)
+    except Exception as e:
+        return {'error': str(e)}
\ No newline at end of file
@@ -0,0 +1,17 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+# Jobs sent to a worker per round trip; chunks amortize the IPC cost
+BATCH_CHUNKSIZE = 8
+
+def run_batch(func: Callable, *iterables: Iterable, max_workers: Optional[int] = None, chunksize: int = BATCH_CHUNKSIZE) -> List:
+    """Map a module-level func over independent CPU-bound jobs in worker processes, results in input order"""
+    job_args = [list(iterable) for iterable in iterables]
+    job_count = min((len(args) for args in job_args), default=0)
+    if job_count == 0:
+        return []
+
+    max_workers = max_workers or min(job_count, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *job_args, chunksize=chunksize))
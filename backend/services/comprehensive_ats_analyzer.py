@@ -1,13 +1,107 @@
 import re
+import copy
+import json
+import hashlib
 import nltk
 from collections import Counter
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Iterable
 import logging
+import numpy as np
+import ahocorasick
 import textstat
+from cachetools import LRUCache
+from services.job_description import job_description_digest
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import
+WORD_PATTERN = re.compile(r'\b\w{4,}\b')
+PHONE_PATTERN = re.compile(r'(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
+CITY_STATE_PATTERN = re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+JOB_TITLE_PATTERN = re.compile(r'\b(manager|director|engineer|analyst|specialist|coordinator|assistant|supervisor|lead|senior|junior)\b', re.IGNORECASE)
+COMPANY_PATTERN = re.compile(r'\b(inc|llc|corp|company|ltd|organization|university|hospital)\b', re.IGNORECASE)
+# Each date style is a named group, so match.lastgroup tells which style was used
+DATE_FORMAT_PATTERN = re.compile(
+    r'(?P<numeric>\b\d{1,2}/\d{4})|(?P<year_range>\b\d{4}[-–]\d{4})|(?P<month_name>\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
+    re.IGNORECASE
+)
+# Any bullet marker; two-character matches (marker + whitespace) are counted as bullet points
+BULLET_MARKER_PATTERN = re.compile(r'[•●▪]\s?|[*-]\s')
+GPA_PATTERN = re.compile(r'gpa\s*:?\s*([3-4]\.[5-9]|4\.0)')
+DEGREE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\b(bachelor|master|phd|doctorate|associate|diploma)\b',
+    r'\b(b\.?[sa]\.?|m\.?[sa]\.?|ph\.?d\.?|m\.?b\.?a\.?)\b'
+))
+
+# Measurable language in a headline or summary, as one alternation so a single search answers "any of them"
+SUMMARY_MEASURABLE_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'\d+\+?\s*years?', r'\d+%', r'\$\d+', r'\d+\s*(million|thousand|k\b)', r'increased?.*\d+', r'improved?.*\d+'
+)), re.IGNORECASE)
+
+# Quantified results in work experience; kept separate because every pattern's matches are counted
+QUANTIFIABLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b\d+%', r'\$\d+', r'\b\d+\s*(million|thousand|k\b)',
+    r'\b\d+\+?\s*(people|employees|team|members)',
+    r'increased?.*\d+', r'decreased?.*\d+', r'improved?.*\d+', r'reduced?.*\d+',
+    r'achieved?.*\d+', r'generated?.*\d+', r'saved?.*\d+'
+))
+
+# Measurable outcomes of projects and achievements
+PROJECT_MEASURABLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b\d+%', r'\$\d+', r'\b\d+\s*(users|students|people|clients)', r'trained \d+', r'helped \d+'
+))
+
+def build_term_automaton(terms: Iterable[str]) -> ahocorasick.Automaton:
+    """Build an automaton matching every term in a single pass"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+def count_terms(automaton: ahocorasick.Automaton, text_lower: str) -> Counter:
+    """Count non-overlapping occurrences of each term in one pass, like str.count"""
+    counts = Counter()
+    next_start = {}
+    for end_index, term in automaton.iter(text_lower):
+        start_index = end_index - len(term) + 1
+        if start_index >= next_start.get(term, 0):
+            counts[term] += 1
+            next_start[term] = end_index + 1
+    return counts
+
+# Checklist keyword lists, all matched as substrings of the lowercased resume
+LOCATION_KEYWORDS = frozenset(['city', 'state', 'location', 'address', 'remote', 'relocation'])
+PORTFOLIO_PATTERNS = frozenset(['github.com', 'portfolio', 'website', 'https://', 'http://'])
+HEADLINE_INDICATORS = ('summary', 'objective', 'profile', 'professional summary', 'career objective')
+COMMON_KEYWORDS = frozenset(['experience', 'skilled', 'expertise', 'specialist', 'professional', 'manager', 'developer', 'analyst'])
+GENERIC_PHRASES = frozenset(['hard working', 'hardworking', 'team player', 'detail oriented', 'motivated', 'passionate'])
+SKILLS_INDICATORS = frozenset(['skills', 'technical skills', 'core competencies', 'technologies', 'expertise'])
+INSTITUTION_INDICATORS = frozenset(['university', 'college', 'institute', 'school', 'academy'])
+COURSEWORK_INDICATORS = frozenset(['coursework', 'relevant courses', 'courses', 'curriculum'])
+CERT_ACRONYMS = ('pmp', 'cfa', 'cpa', 'cissp', 'aws', 'csm')
+CERT_SECTION_INDICATORS = frozenset(['certification', 'license', 'credential'])
+PROJECT_INDICATORS = frozenset(['project', 'achievement', 'accomplishment', 'portfolio', 'volunteer'])
+VOLUNTEER_KEYWORDS = frozenset(['volunteer', 'community', 'nonprofit', 'charity', 'leadership'])
+VAGUE_WORDS = ('helped', 'worked on', 'participated', 'involved', 'responsible for')
+IMPORTANT_KEYWORDS = ('experience', 'management', 'development', 'analysis', 'project')
+STANDARD_HEADINGS = ('experience', 'education', 'skills', 'summary')
+
+# One automaton finds and counts every checklist keyword in a single pass
+CHECKLIST_TERM_AUTOMATON = build_term_automaton(
+    LOCATION_KEYWORDS | PORTFOLIO_PATTERNS | set(HEADLINE_INDICATORS) | COMMON_KEYWORDS | GENERIC_PHRASES |
+    SKILLS_INDICATORS | INSTITUTION_INDICATORS | COURSEWORK_INDICATORS | set(CERT_ACRONYMS) |
+    CERT_SECTION_INDICATORS | PROJECT_INDICATORS | VOLUNTEER_KEYWORDS | set(VAGUE_WORDS) |
+    set(IMPORTANT_KEYWORDS) | set(STANDARD_HEADINGS)
+)
+
+# Job description features keyed by job_description_digest, shared by all analyzer instances
+jd_features_cache = LRUCache(maxsize=256)
+
 class ComprehensiveATSAnalyzer:
     def __init__(self):
         # Standard sections expected in resumes
@@ -58,6 +152,18 @@ class ComprehensiveATSAnalyzer:
         
         # ATS-friendly fonts
         self.ats_fonts = ['arial', 'calibri', 'times new roman', 'helvetica', 'georgia', 'trebuchet ms', 'verdana']
+        
+        # Technical skills of every category, in category order
+        self.technical_skills = tuple(skill for skills_list in self.skill_categories['technical'].values() for skill in skills_list)
+        self.technical_skill_set = frozenset(self.technical_skills)
+        
+        # Skills, certifications and action verbs counted in a single pass over a text
+        self.term_automaton = build_term_automaton(
+            self.technical_skill_set | set(self.skill_categories['soft']) | set(self.certifications) | set(self.action_verbs)
+        )
+        
+        # Finished analyses keyed by digests of every input they read
+        self.analysis_cache = LRUCache(maxsize=256)
 
     def analyze_comprehensive(self, parsed_resume: Dict, job_description: str = None, job_title: str = None) -> Dict:
         """Comprehensive ATS analysis following the detailed checklist"""
@@ -67,16 +173,31 @@ class ComprehensiveATSAnalyzer:
             if not text:
                 raise ValueError("No text content found in resume")
             
+            # Besides the text, only formatting_info is read from the parsed resume
+            formatting_info = parsed_resume.get('formatting_info', {})
+            cache_key = (
+                hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(),
+                hashlib.blake2b(json.dumps(formatting_info, sort_keys=True, default=str).encode('utf-8'), digest_size=16).digest(),
+                job_description,
+                job_title
+            )
+            cached_analysis = self.analysis_cache.get(cache_key)
+            if cached_analysis is not None:
+                return copy.deepcopy(cached_analysis)
+            
+            # Lowercase, split and tokenize the resume once for all components
+            text_features = self.extract_text_features(text)
+            
             # Extract all required analysis components
-            contact_analysis = self.analyze_contact_information(text)
-            headline_analysis = self.analyze_headline_summary(text)
-            skills_analysis = self.analyze_skills_section(text, job_description)
-            experience_analysis = self.analyze_work_experience(text, job_description)
-            education_analysis = self.analyze_education(text)
-            certifications_analysis = self.analyze_certifications(text, job_description)
-            projects_analysis = self.analyze_projects_achievements(text)
-            keywords_analysis = self.analyze_keywords_relevance(text, job_description, job_title)
-            formatting_analysis = self.analyze_formatting_readability(text, parsed_resume.get('formatting_info', {}))
+            contact_analysis = self.analyze_contact_information(text, text_features)
+            headline_analysis = self.analyze_headline_summary(text, text_features)
+            skills_analysis = self.analyze_skills_section(text, text_features, job_description)
+            experience_analysis = self.analyze_work_experience(text, text_features, job_description)
+            education_analysis = self.analyze_education(text, text_features)
+            certifications_analysis = self.analyze_certifications(text, text_features, job_description)
+            projects_analysis = self.analyze_projects_achievements(text, text_features)
+            keywords_analysis = self.analyze_keywords_relevance(text, text_features, job_description, job_title)
+            formatting_analysis = self.analyze_formatting_readability(text, text_features, formatting_info)
             
             # Calculate component scores
             scores = self.calculate_component_scores(
@@ -97,29 +218,102 @@ class ComprehensiveATSAnalyzer:
             # Prepare pie chart data
             pie_chart_data = self.prepare_pie_chart_data(scores)
             
-            return {
+            detailed_analysis = {
+                'contact_information': contact_analysis,
+                'headline_summary': headline_analysis,
+                'skills_section': skills_analysis,
+                'work_experience': experience_analysis,
+                'education': education_analysis,
+                'certifications': certifications_analysis,
+                'projects_achievements': projects_analysis,
+                'keywords_relevance': keywords_analysis,
+                'formatting_readability': formatting_analysis
+            }
+            
+            # Key metrics and frontend issues, gathered in one pass over the sections
+            sections_count = 0
+            issues = []
+            for section_name, section in detailed_analysis.items():
+                if section['score'] > 0:
+                    sections_count += 1
+                if section['recommendations']:
+                    severity = 'critical' if section['score'] < 50 else 'warning'
+                    title = f"{section_name.replace('_', ' ').title()} Issue"
+                    for rec in section['recommendations']:
+                        issues.append({
+                            'severity': severity,
+                            'title': title,
+                            'description': rec
+                        })
+            total_keywords = len(skills_analysis['skills_found']['technical']) + len(skills_analysis['skills_found']['soft'])
+            
+            analysis = {
                 'executive_summary': executive_summary,
-                'detailed_analysis': {
-                    'contact_information': contact_analysis,
-                    'headline_summary': headline_analysis,
-                    'skills_section': skills_analysis,
-                    'work_experience': experience_analysis,
-                    'education': education_analysis,
-                    'certifications': certifications_analysis,
-                    'projects_achievements': projects_analysis,
-                    'keywords_relevance': keywords_analysis,
-                    'formatting_readability': formatting_analysis
-                },
+                'detailed_analysis': detailed_analysis,
                 'ats_scorecard': scores,
+                'total_keywords': total_keywords,
+                'sections_count': sections_count,
+                'issues': issues,
                 'pie_chart_data': pie_chart_data,
                 'final_recommendations': final_recommendations
             }
             
+            self.analysis_cache[cache_key] = copy.deepcopy(analysis)
+            
+            return analysis
+            
         except Exception as e:
             logger.error(f"Comprehensive analysis error: {str(e)}")
             raise e
 
-    def analyze_contact_information(self, text: str) -> Dict:
+    def clear_analysis_cache(self):
+        """Drop all cached analyses, e.g. before a batch run"""
+        self.analysis_cache.clear()
+
+    def extract_jd_features(self, job_description: str) -> Dict:
+        """Extract job description text features once per distinct description"""
+        cache_key = job_description_digest(job_description)
+        jd_features = jd_features_cache.get(cache_key)
+        if jd_features is not None:
+            return jd_features
+        
+        jd_lower = job_description.lower()
+        jd_terms = self.count_skill_terms(jd_lower)
+        jd_technical = [skill for skill in self.technical_skills if skill in jd_terms]
+        jd_soft = [skill for skill in self.skill_categories['soft'] if skill in jd_terms]
+        
+        jd_features = {
+            'jd_words': frozenset(WORD_PATTERN.findall(jd_lower)),
+            'jd_technical': tuple(jd_technical),
+            'jd_soft': tuple(jd_soft)
+        }
+        jd_features_cache[cache_key] = jd_features
+        return jd_features
+
+    def extract_text_features(self, text: str) -> Dict:
+        """Extract resume text features shared by every analysis component"""
+        text_lower = text.lower()
+        tokens = text.split()
+        bullet_markers = BULLET_MARKER_PATTERN.findall(text)
+        
+        return {
+            'text_lower': text_lower,
+            'lines': text.split('\n'),
+            'tokens': tokens,
+            'word_count': len(tokens),
+            'words': frozenset(WORD_PATTERN.findall(text_lower)),
+            'term_counts': self.count_skill_terms(text_lower),
+            'checklist_terms': count_terms(CHECKLIST_TERM_AUTOMATON, text_lower),
+            'years': np.fromiter(map(int, YEAR_PATTERN.findall(text)), dtype=np.int16),
+            'has_bullets': bool(bullet_markers),
+            'bullet_count': sum(1 for marker in bullet_markers if len(marker) == 2)
+        }
+
+    def count_skill_terms(self, text_lower: str) -> Counter:
+        """Count skills, certifications and action verbs in lowercased text"""
+        return count_terms(self.term_automaton, text_lower)
+
+    def analyze_contact_information(self, text: str, text_features: Dict) -> Dict:
         """Analyze contact information section"""
         analysis = {
             'checklist': {},
@@ -127,41 +321,37 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
+        checklist_terms = text_features['checklist_terms']
+        lines = text_features['lines']
+        
         # Check for name (usually in first few lines)
-        lines = text.split('\n')[:5]
         has_name = any(len(line.strip().split()) >= 2 and 
                       not '@' in line and not any(char.isdigit() for char in line) 
-                      for line in lines if line.strip())
+                      for line in lines[:5] if line.strip())
         analysis['checklist']['name_plain_text'] = has_name
         
         # Check for phone number
-        phone_pattern = r'(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        has_phone = bool(re.search(phone_pattern, text))
+        has_phone = bool(PHONE_PATTERN.search(text))
         analysis['checklist']['phone_number'] = has_phone
         
         # Check for professional email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text, re.IGNORECASE)
+        emails = EMAIL_PATTERN.findall(text)
         has_professional_email = bool(emails)
         analysis['checklist']['professional_email'] = has_professional_email
         
         # Check for location
-        location_keywords = ['city', 'state', 'location', 'address', 'remote', 'relocation']
-        has_location = any(keyword in text.lower() for keyword in location_keywords) or \
-                      bool(re.search(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b', text))  # City, ST format
+        has_location = not LOCATION_KEYWORDS.isdisjoint(checklist_terms) or \
+                      bool(CITY_STATE_PATTERN.search(text))  # City, ST format
         analysis['checklist']['location'] = has_location
         
         # Check for LinkedIn/portfolio
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        portfolio_patterns = ['github.com', 'portfolio', 'website', 'https://', 'http://']
-        has_linkedin = bool(re.search(linkedin_pattern, text, re.IGNORECASE))
-        has_portfolio = any(pattern in text.lower() for pattern in portfolio_patterns)
+        has_linkedin = bool(LINKEDIN_PATTERN.search(text))
+        has_portfolio = not PORTFOLIO_PATTERNS.isdisjoint(checklist_terms)
         analysis['checklist']['linkedin_portfolio'] = has_linkedin or has_portfolio
         
         # Check for header/footer issues (heuristic)
-        lines = text.split('\n')
-        first_line_contact = any(pattern in lines[0].lower() if lines else False 
-                               for pattern in ['phone', 'email', '@', 'linkedin'])
+        first_line_lower = lines[0].lower()  # split always yields at least one line
+        first_line_contact = any(pattern in first_line_lower for pattern in ['phone', 'email', '@', 'linkedin'])
         analysis['checklist']['no_header_footer'] = not first_line_contact
         
         # Calculate score
@@ -182,7 +372,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_headline_summary(self, text: str) -> Dict:
+    def analyze_headline_summary(self, text: str, text_features: Dict) -> Dict:
         """Analyze headline/objective/summary section"""
         analysis = {
             'checklist': {},
@@ -190,11 +380,12 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
-        lines = text.split('\n')
+        text_lower = text_features['text_lower']
+        checklist_terms = text_features['checklist_terms']
+        lines = text_features['lines']
         
         # Look for headline (usually after name, before main content)
-        headline_indicators = ['summary', 'objective', 'profile', 'professional summary', 'career objective']
-        has_headline_section = any(indicator in text.lower() for indicator in headline_indicators)
+        has_headline_section = any(indicator in checklist_terms for indicator in HEADLINE_INDICATORS)
         
         # Check for clear headline/title
         potential_headlines = []
@@ -211,9 +402,9 @@ class ComprehensiveATSAnalyzer:
         summary_text = ""
         if has_headline_section:
             # Extract text after summary indicators
-            for indicator in headline_indicators:
-                if indicator in text.lower():
-                    start_idx = text.lower().find(indicator)
+            for indicator in HEADLINE_INDICATORS:
+                if indicator in checklist_terms:
+                    start_idx = text_lower.find(indicator)
                     # Get next few lines
                     remaining_text = text[start_idx:]
                     summary_lines = remaining_text.split('\n')[1:5]  # Next 4 lines
@@ -225,18 +416,15 @@ class ComprehensiveATSAnalyzer:
         analysis['checklist']['summary_length'] = has_appropriate_length
         
         # Check for role-specific keywords
-        common_keywords = ['experience', 'skilled', 'expertise', 'specialist', 'professional', 'manager', 'developer', 'analyst']
-        has_keywords = any(keyword in text.lower() for keyword in common_keywords)
+        has_keywords = not COMMON_KEYWORDS.isdisjoint(checklist_terms)
         analysis['checklist']['role_keywords'] = has_keywords
         
         # Check for measurable language
-        measurable_patterns = [r'\d+\+?\s*years?', r'\d+%', r'\$\d+', r'\d+\s*(million|thousand|k\b)', r'increased?.*\d+', r'improved?.*\d+']
-        has_measurable = any(re.search(pattern, text, re.IGNORECASE) for pattern in measurable_patterns)
+        has_measurable = bool(SUMMARY_MEASURABLE_PATTERN.search(text))
         analysis['checklist']['measurable_language'] = has_measurable
         
         # Check for generic phrases
-        generic_phrases = ['hard working', 'hardworking', 'team player', 'detail oriented', 'motivated', 'passionate']
-        has_generic = any(phrase in text.lower() for phrase in generic_phrases)
+        has_generic = not GENERIC_PHRASES.isdisjoint(checklist_terms)
         analysis['checklist']['avoid_generic'] = not has_generic
         
         # Calculate score
@@ -257,7 +445,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_skills_section(self, text: str, job_description: str = None) -> Dict:
+    def analyze_skills_section(self, text: str, text_features: Dict, job_description: str = None) -> Dict:
         """Analyze skills section"""
         analysis = {
             'checklist': {},
@@ -267,25 +455,14 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
-        text_lower = text.lower()
-        
         # Check for dedicated skills section
-        skills_indicators = ['skills', 'technical skills', 'core competencies', 'technologies', 'expertise']
-        has_skills_section = any(indicator in text_lower for indicator in skills_indicators)
+        has_skills_section = not SKILLS_INDICATORS.isdisjoint(text_features['checklist_terms'])
         analysis['checklist']['dedicated_section'] = has_skills_section
         
-        # Extract technical skills
-        technical_skills = []
-        for category, skills_list in self.skill_categories['technical'].items():
-            for skill in skills_list:
-                if skill in text_lower:
-                    technical_skills.append(skill)
-        
-        # Extract soft skills
-        soft_skills = []
-        for skill in self.skill_categories['soft']:
-            if skill in text_lower:
-                soft_skills.append(skill)
+        # Extract technical and soft skills
+        term_counts = text_features['term_counts']
+        technical_skills = [skill for skill in self.technical_skills if skill in term_counts]
+        soft_skills = [skill for skill in self.skill_categories['soft'] if skill in term_counts]
         
         analysis['skills_found']['technical'] = technical_skills
         analysis['skills_found']['soft'] = soft_skills
@@ -302,20 +479,10 @@ class ComprehensiveATSAnalyzer:
         
         # Job description matching if provided
         if job_description:
-            jd_lower = job_description.lower()
-            
-            # Extract skills from job description
-            jd_technical = []
-            jd_soft = []
-            
-            for category, skills_list in self.skill_categories['technical'].items():
-                for skill in skills_list:
-                    if skill in jd_lower:
-                        jd_technical.append(skill)
-            
-            for skill in self.skill_categories['soft']:
-                if skill in jd_lower:
-                    jd_soft.append(skill)
+            # Skills from job description
+            jd_features = self.extract_jd_features(job_description)
+            jd_technical = jd_features['jd_technical']
+            jd_soft = jd_features['jd_soft']
             
             total_jd_skills = len(jd_technical) + len(jd_soft)
             matched_skills = len(set(technical_skills) & set(jd_technical)) + len(set(soft_skills) & set(jd_soft))
@@ -328,8 +495,8 @@ class ComprehensiveATSAnalyzer:
             analysis['checklist']['job_keywords'] = True  # Default to true if no JD
         
         # Check for overstuffing
-        skill_mentions = sum(text_lower.count(skill) for skill in technical_skills + soft_skills)
-        word_count = len(text.split())
+        skill_mentions = sum(term_counts[skill] for skill in technical_skills + soft_skills)
+        word_count = text_features['word_count']
         skill_density = (skill_mentions / word_count) * 100 if word_count > 0 else 0
         no_overstuffing = skill_density < 15  # Less than 15% skill density
         analysis['checklist']['no_overstuffing'] = no_overstuffing
@@ -354,7 +521,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_work_experience(self, text: str, job_description: str = None) -> Dict:
+    def analyze_work_experience(self, text: str, text_features: Dict, job_description: str = None) -> Dict:
         """Analyze work experience section"""
         analysis = {
             'checklist': {},
@@ -364,47 +531,40 @@ class ComprehensiveATSAnalyzer:
         }
         
         # Check for reverse chronological order
-        years = re.findall(r'\b(19|20)\d{2}\b', text)
-        is_reverse_chronological = len(years) >= 2 and all(int(years[i]) >= int(years[i+1]) for i in range(len(years)-1))
-        analysis['checklist']['reverse_chronological'] = is_reverse_chronological or len(years) < 2
+        years = text_features['years']
+        is_reverse_chronological = years.size >= 2 and bool(np.all(years[:-1] >= years[1:]))
+        analysis['checklist']['reverse_chronological'] = is_reverse_chronological or years.size < 2
         
         # Check for required components
-        has_job_titles = bool(re.search(r'\b(manager|director|engineer|analyst|specialist|coordinator|assistant|supervisor|lead|senior|junior)\b', text, re.IGNORECASE))
+        has_job_titles = bool(JOB_TITLE_PATTERN.search(text))
         analysis['checklist']['job_titles'] = has_job_titles
         
-        has_companies = bool(re.search(r'\b(inc|llc|corp|company|ltd|organization|university|hospital)\b', text, re.IGNORECASE))
+        has_companies = bool(COMPANY_PATTERN.search(text))
         analysis['checklist']['company_names'] = has_companies
         
-        has_locations = bool(re.search(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b', text))
+        has_locations = bool(CITY_STATE_PATTERN.search(text))
         analysis['checklist']['locations'] = has_locations
         
-        has_dates = len(years) > 0
+        has_dates = years.size > 0
         analysis['checklist']['dates'] = has_dates
         
         # Check date formatting consistency
-        date_formats = re.findall(r'\b\d{1,2}/\d{4}|\b\d{4}[-–]\d{4}|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}', text, re.IGNORECASE)
-        consistent_dates = len(set(type(d) for d in date_formats)) <= 2 if date_formats else False
-        analysis['checklist']['consistent_dates'] = consistent_dates or len(date_formats) == 0
+        date_styles = {match.lastgroup for match in DATE_FORMAT_PATTERN.finditer(text)}
+        analysis['checklist']['consistent_dates'] = len(date_styles) <= 1
         
         # Check for bullet points
-        bullet_patterns = [r'•', r'●', r'▪', r'-\s', r'\*\s']
-        has_bullets = any(re.search(pattern, text) for pattern in bullet_patterns)
+        has_bullets = text_features['has_bullets']
         analysis['checklist']['bullet_points'] = has_bullets
         
         # Check for action verbs
-        action_verb_count = sum(1 for verb in self.action_verbs if verb in text.lower())
+        term_counts = text_features['term_counts']
+        action_verb_count = sum(1 for verb in self.action_verbs if verb in term_counts)
         has_action_verbs = action_verb_count >= 5
         analysis['checklist']['action_verbs'] = has_action_verbs
         
         # Check for quantifiable achievements
-        quantifiable_patterns = [
-            r'\b\d+%', r'\$\d+', r'\b\d+\s*(million|thousand|k\b)', 
-            r'\b\d+\+?\s*(people|employees|team|members)',
-            r'increased?.*\d+', r'decreased?.*\d+', r'improved?.*\d+', r'reduced?.*\d+',
-            r'achieved?.*\d+', r'generated?.*\d+', r'saved?.*\d+'
-        ]
-        quantifiable_matches = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in quantifiable_patterns)
-        total_bullets = len(re.findall(r'[•●▪*-]\s', text))
+        quantifiable_matches = sum(len(pattern.findall(text)) for pattern in QUANTIFIABLE_PATTERNS)
+        total_bullets = text_features['bullet_count']
         
         if total_bullets > 0:
             analysis['quantifiable_impact_percentage'] = (quantifiable_matches / total_bullets) * 100
@@ -414,8 +574,8 @@ class ComprehensiveATSAnalyzer:
         
         # Check for role-specific keywords
         if job_description:
-            jd_words = set(re.findall(r'\b\w{4,}\b', job_description.lower()))
-            resume_words = set(re.findall(r'\b\w{4,}\b', text.lower()))
+            jd_words = self.extract_jd_features(job_description)['jd_words']
+            resume_words = text_features['words']
             keyword_overlap = len(jd_words & resume_words) / len(jd_words) if jd_words else 0
             has_keywords = keyword_overlap > 0.2
         else:
@@ -432,7 +592,7 @@ class ComprehensiveATSAnalyzer:
         analysis['score'] = (sum(checklist_items) / len(checklist_items)) * 100
         
         # Generate recommendations
-        if not is_reverse_chronological and len(years) >= 2:
+        if not is_reverse_chronological and years.size >= 2:
             analysis['recommendations'].append("Organize work experience in reverse chronological order")
         if not has_job_titles:
             analysis['recommendations'].append("Include clear job titles for each position")
@@ -449,7 +609,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_education(self, text: str) -> Dict:
+    def analyze_education(self, text: str, text_features: Dict) -> Dict:
         """Analyze education section"""
         analysis = {
             'checklist': {},
@@ -457,34 +617,26 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
-        text_lower = text.lower()
+        text_lower = text_features['text_lower']
         
         # Check for institution names
-        institution_indicators = ['university', 'college', 'institute', 'school', 'academy']
-        has_institution = any(indicator in text_lower for indicator in institution_indicators)
+        has_institution = not INSTITUTION_INDICATORS.isdisjoint(text_features['checklist_terms'])
         analysis['checklist']['institution_name'] = has_institution
         
         # Check for degree names
-        degree_patterns = [
-            r'\b(bachelor|master|phd|doctorate|associate|diploma)\b',
-            r'\b(b\.?[sa]\.?|m\.?[sa]\.?|ph\.?d\.?|m\.?b\.?a\.?)\b'
-        ]
-        has_degree = any(re.search(pattern, text_lower) for pattern in degree_patterns)
+        has_degree = any(pattern.search(text_lower) for pattern in DEGREE_PATTERNS)
         analysis['checklist']['degree_name'] = has_degree
         
         # Check for graduation dates
-        education_years = re.findall(r'\b(19|20)\d{2}\b', text)
-        has_dates = len(education_years) > 0
+        has_dates = text_features['years'].size > 0
         analysis['checklist']['graduation_dates'] = has_dates
         
         # Check for relevant coursework (more common for entry-level)
-        coursework_indicators = ['coursework', 'relevant courses', 'courses', 'curriculum']
-        has_coursework = any(indicator in text_lower for indicator in coursework_indicators)
+        has_coursework = not COURSEWORK_INDICATORS.isdisjoint(text_features['checklist_terms'])
         analysis['checklist']['relevant_coursework'] = has_coursework
         
         # Check for GPA (only if strong)
-        gpa_pattern = r'gpa\s*:?\s*([3-4]\.[5-9]|4\.0)'
-        has_strong_gpa = bool(re.search(gpa_pattern, text_lower))
+        has_strong_gpa = bool(GPA_PATTERN.search(text_lower))
         analysis['checklist']['gpa_included'] = has_strong_gpa or 'gpa' not in text_lower  # Good if no GPA or strong GPA
         
         # Calculate score
@@ -503,7 +655,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_certifications(self, text: str, job_description: str = None) -> Dict:
+    def analyze_certifications(self, text: str, text_features: Dict, job_description: str = None) -> Dict:
         """Analyze certifications section"""
         analysis = {
             'checklist': {},
@@ -512,13 +664,11 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
-        text_lower = text.lower()
+        checklist_terms = text_features['checklist_terms']
         
         # Find certifications
-        found_certs = []
-        for cert in self.certifications:
-            if cert in text_lower:
-                found_certs.append(cert)
+        term_counts = text_features['term_counts']
+        found_certs = [cert for cert in self.certifications if cert in term_counts]
         
         analysis['certifications_found'] = found_certs
         
@@ -530,14 +680,12 @@ class ComprehensiveATSAnalyzer:
         analysis['checklist']['valid_not_expired'] = True  # Hard to verify without dates
         
         # Check for acronym expansion
-        cert_acronyms = ['pmp', 'cfa', 'cpa', 'cissp', 'aws', 'csm']
-        has_expansions = any(f"{acronym}" in text_lower and len([word for word in text.split() if acronym.upper() in word.upper()]) > 1 
-                           for acronym in cert_acronyms if acronym in text_lower)
+        has_expansions = any(len([word for word in text_features['tokens'] if acronym.upper() in word.upper()]) > 1 
+                           for acronym in CERT_ACRONYMS if acronym in checklist_terms)
         analysis['checklist']['acronyms_spelled_out'] = has_expansions or len(found_certs) == 0
         
         # Check for separate section
-        cert_section_indicators = ['certification', 'license', 'credential']
-        has_separate_section = any(indicator in text_lower for indicator in cert_section_indicators)
+        has_separate_section = not CERT_SECTION_INDICATORS.isdisjoint(checklist_terms)
         analysis['checklist']['separate_section'] = has_separate_section or len(found_certs) == 0
         
         # Calculate score
@@ -565,7 +713,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_projects_achievements(self, text: str) -> Dict:
+    def analyze_projects_achievements(self, text: str, text_features: Dict) -> Dict:
         """Analyze projects and achievements section"""
         analysis = {
             'checklist': {},
@@ -574,22 +722,21 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
-        text_lower = text.lower()
+        checklist_terms = text_features['checklist_terms']
         
         # Check for projects section
-        project_indicators = ['project', 'achievement', 'accomplishment', 'portfolio', 'volunteer']
-        has_projects = any(indicator in text_lower for indicator in project_indicators)
+        has_projects = not PROJECT_INDICATORS.isdisjoint(checklist_terms)
         analysis['checklist']['projects_described'] = has_projects
         
         # Check for technology/skills used
-        tech_mentioned = any(skill in text_lower for category in self.skill_categories['technical'].values() for skill in category)
+        term_counts = text_features['term_counts']
+        tech_mentioned = not self.technical_skill_set.isdisjoint(term_counts)
         analysis['checklist']['technology_skills_listed'] = tech_mentioned
         
         # Check for measurable achievements
-        measurable_patterns = [r'\b\d+%', r'\$\d+', r'\b\d+\s*(users|students|people|clients)', r'trained \d+', r'helped \d+']
-        measurable_count = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in measurable_patterns)
+        measurable_count = sum(len(pattern.findall(text)) for pattern in PROJECT_MEASURABLE_PATTERNS)
         
-        total_achievements = text_lower.count('project') + text_lower.count('achievement') + text_lower.count('volunteer')
+        total_achievements = checklist_terms['project'] + checklist_terms['achievement'] + checklist_terms['volunteer']
         if total_achievements > 0:
             analysis['measurable_percentage'] = (measurable_count / total_achievements) * 100
         
@@ -597,14 +744,12 @@ class ComprehensiveATSAnalyzer:
         analysis['checklist']['measurable_achievements'] = has_measurable
         
         # Check for relevant volunteer work
-        volunteer_keywords = ['volunteer', 'community', 'nonprofit', 'charity', 'leadership']
-        has_relevant_volunteer = any(keyword in text_lower for keyword in volunteer_keywords)
-        analysis['checklist']['relevant_volunteer'] = has_relevant_volunteer or not any('volunteer' in text_lower for _ in range(1))
+        has_relevant_volunteer = not VOLUNTEER_KEYWORDS.isdisjoint(checklist_terms)
+        analysis['checklist']['relevant_volunteer'] = has_relevant_volunteer or 'volunteer' not in checklist_terms
         
         # Check for vague descriptions
-        vague_words = ['helped', 'worked on', 'participated', 'involved', 'responsible for']
-        vague_count = sum(text_lower.count(word) for word in vague_words)
-        total_words = len(text.split())
+        vague_count = sum(checklist_terms[word] for word in VAGUE_WORDS)
+        total_words = text_features['word_count']
         has_specific_descriptions = (vague_count / total_words * 100) < 5 if total_words > 0 else True
         analysis['checklist']['no_vague_descriptions'] = has_specific_descriptions
         
@@ -624,7 +769,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_keywords_relevance(self, text: str, job_description: str = None, job_title: str = None) -> Dict:
+    def analyze_keywords_relevance(self, text: str, text_features: Dict, job_description: str = None, job_title: str = None) -> Dict:
         """Analyze keywords and industry relevance"""
         analysis = {
             'checklist': {},
@@ -634,20 +779,18 @@ class ComprehensiveATSAnalyzer:
             'recommendations': []
         }
         
-        text_lower = text.lower()
+        text_lower = text_features['text_lower']
         
         if job_description:
-            jd_lower = job_description.lower()
-            
             # Extract keywords from job description
-            jd_words = set(re.findall(r'\b\w{4,}\b', jd_lower))
+            jd_words = self.extract_jd_features(job_description)['jd_words']
             
             # Remove common words
             common_words = {'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their'}
             jd_keywords = jd_words - common_words
             
             # Find matching keywords
-            resume_words = set(re.findall(r'\b\w{4,}\b', text_lower))
+            resume_words = text_features['words']
             matched_keywords = jd_keywords & resume_words
             
             # Calculate match percentage
@@ -662,8 +805,9 @@ class ComprehensiveATSAnalyzer:
             analysis['checklist']['jd_keywords_included'] = True
         
         # Check hard and soft skills balance
-        tech_skills = sum(1 for category in self.skill_categories['technical'].values() for skill in category if skill in text_lower)
-        soft_skills = sum(1 for skill in self.skill_categories['soft'] if skill in text_lower)
+        term_counts = text_features['term_counts']
+        tech_skills = sum(1 for skill in self.technical_skills if skill in term_counts)
+        soft_skills = sum(1 for skill in self.skill_categories['soft'] if skill in term_counts)
         
         has_balance = tech_skills > 0 and soft_skills > 0
         analysis['checklist']['hard_soft_balance'] = has_balance
@@ -683,12 +827,12 @@ class ComprehensiveATSAnalyzer:
         analysis['checklist']['industry_terms'] = has_industry_terms
         
         # Check keyword frequency (2-3 times per important keyword)
-        important_keywords = ['experience', 'management', 'development', 'analysis', 'project']
-        appropriate_frequency = all(2 <= text_lower.count(keyword) <= 5 for keyword in important_keywords if keyword in text_lower)
+        checklist_terms = text_features['checklist_terms']
+        appropriate_frequency = all(2 <= checklist_terms[keyword] <= 5 for keyword in IMPORTANT_KEYWORDS if keyword in checklist_terms)
         analysis['checklist']['appropriate_frequency'] = appropriate_frequency
         
         # Check for keyword stuffing
-        word_count = len(text.split())
+        word_count = text_features['word_count']
         keyword_density = (tech_skills + soft_skills) / word_count * 100 if word_count > 0 else 0
         no_stuffing = keyword_density < 15
         analysis['checklist']['no_keyword_stuffing'] = no_stuffing
@@ -709,7 +853,7 @@ class ComprehensiveATSAnalyzer:
         
         return analysis
 
-    def analyze_formatting_readability(self, text: str, formatting_info: Dict) -> Dict:
+    def analyze_formatting_readability(self, text: str, text_features: Dict, formatting_info: Dict) -> Dict:
         """Analyze formatting and readability"""
         analysis = {
             'checklist': {},
@@ -729,8 +873,7 @@ class ComprehensiveATSAnalyzer:
         analysis['checklist']['no_tables'] = has_no_tables
         
         # Check section headings
-        standard_headings = ['experience', 'education', 'skills', 'summary']
-        headings_found = sum(1 for heading in standard_headings if heading in text.lower())
+        headings_found = sum(1 for heading in STANDARD_HEADINGS if heading in text_features['checklist_terms'])
         has_standard_headings = headings_found >= 3
         analysis['checklist']['standard_headings'] = has_standard_headings
         
@@ -746,13 +889,12 @@ class ComprehensiveATSAnalyzer:
         analysis['checklist']['appropriate_font_size'] = True
         
         # Check spacing and alignment (heuristic based on text structure)
-        lines = text.split('\n')
+        lines = text_features['lines']
         consistent_spacing = len([line for line in lines if line.strip()]) / len(lines) > 0.5
         analysis['checklist']['consistent_spacing'] = consistent_spacing
         
         # Check for bullet points
-        bullet_patterns = [r'•', r'●', r'▪', r'-\s', r'\*\s']
-        has_bullets = any(re.search(pattern, text) for pattern in bullet_patterns)
+        has_bullets = text_features['has_bullets']
         analysis['checklist']['bullet_points_used'] = has_bullets
         
         # Check readability
@@ -26,6 +26,9 @@ class FileHandler:
         
         # Maximum file size (10MB)
         self.max_file_size = 10 * 1024 * 1024
+        
+        # Read size when streaming uploads to disk (64KB)
+        self.chunk_size = 64 * 1024
     
     async def save_uploaded_file(self, file_content: bytes, filename: str, content_type: str) -> Tuple[str, str]:
         """Save uploaded file and return file path and detected type"""
@@ -63,6 +66,37 @@ class FileHandler:
             logger.error(f"Error saving file: {str(e)}")
             raise e
     
+    async def save_upload_stream(self, upload_file, filename: str, content_type: str) -> Tuple[str, str, int]:
+        """Stream an upload to disk in chunks and return file path, detected type and size"""
+        # Validate file type before writing anything
+        if content_type not in self.allowed_types:
+            raise ValueError(f"Unsupported file type: {content_type}")
+        
+        # Generate unique filename
+        file_id = str(uuid.uuid4())
+        file_extension = self.get_file_extension(filename, content_type)
+        file_path = self.upload_dir / f"{file_id}{file_extension}"
+        
+        try:
+            file_size = 0
+            async with aiofiles.open(file_path, 'wb') as f:
+                while chunk := await upload_file.read(self.chunk_size):
+                    file_size += len(chunk)
+                    if file_size > self.max_file_size:
+                        raise ValueError(f"File too large (max {self.max_file_size // (1024*1024)}MB)")
+                    await f.write(chunk)
+            
+            self.validate_saved_file(str(file_path), file_size, filename, content_type)
+            
+            logger.info(f"File saved: {file_path}")
+            
+            return str(file_path), self.get_file_type(content_type, filename), file_size
+            
+        except Exception as e:
+            logger.error(f"Error saving file: {str(e)}")
+            file_path.unlink(missing_ok=True)
+            raise e
+    
     def get_file_extension(self, filename: str, content_type: str) -> str:
         """Get appropriate file extension"""
         # First try to get extension from content type
@@ -108,12 +142,22 @@ class FileHandler:
     
     def validate_file(self, file_content: bytes, filename: str, content_type: str) -> bool:
         """Validate uploaded file"""
+        return self.validate_upload(len(file_content), file_content[:4], filename, content_type)
+    
+    def validate_saved_file(self, file_path: str, file_size: int, filename: str, content_type: str) -> bool:
+        """Validate an upload already written to disk"""
+        with open(file_path, 'rb') as f:
+            header = f.read(4)
+        return self.validate_upload(file_size, header, filename, content_type)
+    
+    def validate_upload(self, file_size: int, header: bytes, filename: str, content_type: str) -> bool:
+        """Validate upload size, type and leading bytes"""
         try:
             # Check file size
-            if len(file_content) == 0:
+            if file_size == 0:
                 raise ValueError("File is empty")
             
-            if len(file_content) > self.max_file_size:
+            if file_size > self.max_file_size:
                 raise ValueError(f"File too large (max {self.max_file_size // (1024*1024)}MB)")
             
             # Check content type - be more lenient
@@ -136,7 +180,7 @@ class FileHandler:
             # Basic file content validation
             if filename.lower().endswith('.pdf') or content_type == 'application/pdf':
                 # PDF files should start with %PDF
-                if not file_content.startswith(b'%PDF'):
+                if not header.startswith(b'%PDF'):
                     # Allow files that might be PDFs but have different headers
                     logger.warning(f"PDF file doesn't have standard header, but proceeding: {filename}")
             
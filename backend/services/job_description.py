@@ -0,0 +1,19 @@
+import re
+import hashlib
+from typing import Optional
+
+# Longest accepted job description, in characters after normalization
+MAX_JOB_DESCRIPTION_LENGTH = 20000
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_job_description(job_description: Optional[str]) -> Optional[str]:
+    """Collapse whitespace in a job description, returns None when nothing is left"""
+    if not job_description:
+        return None
+    normalized = WHITESPACE_PATTERN.sub(' ', job_description).strip()
+    return normalized or None
+
+def job_description_digest(job_description: str) -> bytes:
+    """Cache key for a normalized job description, so caches never hold the text itself"""
+    return hashlib.sha256(job_description.encode('utf-8')).digest()
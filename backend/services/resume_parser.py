@@ -1,7 +1,6 @@
 import fitz  # PyMuPDF
 from docx import Document
 import re
-import os
 from typing import Dict, List, Optional
 import logging
 
@@ -57,9 +56,8 @@ class ResumeParser:
         """Extract text from PDF file"""
         try:
             doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            # Collect page text and join once instead of growing a string per page
+            text = "".join([page.get_text() for page in doc])
             doc.close()
             
             # Check if we extracted meaningful text
@@ -142,13 +140,6 @@ class ResumeParser:
         except Exception as e:
             logger.error(f"Error parsing resume: {str(e)}")
             raise e
-        finally:
-            # Clean up the uploaded file
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except:
-                    pass
     
     def analyze_resume_structure(self, text: str) -> Dict:
         """Analyze resume structure and extract sections"""
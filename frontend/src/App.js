@@ -78,6 +78,9 @@ function App() {
     return 'bg-red-600';
   };
 
+  const summary = results?.comprehensive_analysis?.executive_summary;
+  const scorecard = results?.comprehensive_analysis?.ats_scorecard;
+
   return (
     <div className="min-h-screen bg-gray-50 py-8 px-4">
       <div className="max-w-6xl mx-auto">
@@ -161,26 +164,26 @@ function App() {
               
               <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mb-6">
                 <div className="text-center">
-                  <div className={`text-3xl font-bold mb-2 ${results.overall_score >= 80 ? 'text-green-600' : results.overall_score >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
-                    {results.overall_score}%
+                  <div className={`text-3xl font-bold mb-2 ${summary.overall_ats_score >= 80 ? 'text-green-600' : summary.overall_ats_score >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
+                    {summary.overall_ats_score}%
                   </div>
                   <div className="text-sm text-gray-600">Overall ATS Score</div>
                 </div>
                 <div className="text-center">
-                  <div className={`text-3xl font-bold mb-2 ${results.keyword_match >= 80 ? 'text-green-600' : results.keyword_match >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
-                    {results.keyword_match}%
+                  <div className={`text-3xl font-bold mb-2 ${summary.keyword_match >= 80 ? 'text-green-600' : summary.keyword_match >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
+                    {summary.keyword_match}%
                   </div>
                   <div className="text-sm text-gray-600">Keyword Match</div>
                 </div>
                 <div className="text-center">
-                  <div className={`text-3xl font-bold mb-2 ${results.skills_match >= 80 ? 'text-green-600' : results.skills_match >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
-                    {results.skills_match}%
+                  <div className={`text-3xl font-bold mb-2 ${summary.skills_match >= 80 ? 'text-green-600' : summary.skills_match >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
+                    {summary.skills_match}%
                   </div>
                   <div className="text-sm text-gray-600">Skills Match</div>
                 </div>
                 <div className="text-center">
-                  <div className={`text-3xl font-bold mb-2 ${results.formatting_readability >= 80 ? 'text-green-600' : results.formatting_readability >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
-                    {results.formatting_readability}%
+                  <div className={`text-3xl font-bold mb-2 ${summary.formatting_readability >= 80 ? 'text-green-600' : summary.formatting_readability >= 60 ? 'text-yellow-600' : 'text-red-600'}`}>
+                    {summary.formatting_readability}%
                   </div>
                   <div className="text-sm text-gray-600">Formatting & Readability</div>
                 </div>
@@ -188,7 +191,7 @@ function App() {
               
               <div className="bg-blue-50 p-4 rounded-lg">
                 <h3 className="font-semibold text-blue-900 mb-2">Summary Statement</h3>
-                <p className="text-blue-800">{results.summary_statement}</p>
+                <p className="text-blue-800">{summary.summary_statement}</p>
               </div>
             </div>
 
@@ -294,14 +297,14 @@ function App() {
                     <div>
                       <h4 className="font-medium mb-2">Keyword Match Analysis:</h4>
                       <div className="text-sm space-y-1">
-                        <div>Match Percentage: <span className="font-medium">{results.keyword_match}%</span></div>
+                        <div>Match Percentage: <span className="font-medium">{summary.keyword_match}%</span></div>
                         <div>Total Keywords Found: <span className="font-medium">{results.total_keywords}</span></div>
                       </div>
                     </div>
                     <div>
                       <h4 className="font-medium mb-2">Missing Keywords:</h4>
                       <div className="flex flex-wrap gap-1">
-                        {results.missing_keywords?.slice(0, 10).map((keyword, idx) => (
+                        {results.comprehensive_analysis?.detailed_analysis?.keywords_relevance?.missing_keywords?.slice(0, 10).map((keyword, idx) => (
                           <span key={idx} className="bg-red-100 text-red-800 px-2 py-1 rounded text-xs">{keyword}</span>
                         ))}
                       </div>
@@ -319,10 +322,10 @@ function App() {
                 <div>
                   <div className="space-y-4">
                     {[
-                      { label: 'Keyword Match', score: results.keyword_match, color: 'blue' },
-                      { label: 'Skills Match', score: results.skills_match, color: 'green' },
-                      { label: 'Formatting & Structure', score: results.formatting_readability, color: 'yellow' },
-                      { label: 'Experience Relevance', score: results.experience_score, color: 'purple' }
+                      { label: 'Keyword Match', score: summary.keyword_match, color: 'blue' },
+                      { label: 'Skills Match', score: summary.skills_match, color: 'green' },
+                      { label: 'Formatting & Structure', score: summary.formatting_readability, color: 'yellow' },
+                      { label: 'Experience Relevance', score: scorecard.experience_relevance, color: 'purple' }
                     ].map((item, idx) => (
                       <div key={idx} className="flex items-center justify-between">
                         <span className="font-medium">{item.label}:</span>
@@ -343,13 +346,13 @@ function App() {
                 <div>
                   <h3 className="font-semibold mb-3">Overall ATS Readiness</h3>
                   <div className="text-center">
-                    <div className={`text-6xl font-bold mb-2 ${getScoreColor(results.overall_score)}`}>
-                      {results.overall_score}%
+                    <div className={`text-6xl font-bold mb-2 ${getScoreColor(summary.overall_ats_score)}`}>
+                      {summary.overall_ats_score}%
                     </div>
                     <div className="text-lg text-gray-600">
-                      {results.overall_score >= 80 ? '🎉 Excellent' : 
-                       results.overall_score >= 65 ? '👍 Good' : 
-                       results.overall_score >= 50 ? '⚠️ Needs Work' : '❌ Poor'}
+                      {summary.overall_ats_score >= 80 ? '🎉 Excellent' : 
+                       summary.overall_ats_score >= 65 ? '👍 Good' : 
+                       summary.overall_ats_score >= 50 ? '⚠️ Needs Work' : '❌ Poor'}
                     </div>
                   </div>
                 </div>
@@ -361,7 +364,7 @@ function App() {
               <h2 className="text-2xl font-bold text-gray-900 mb-6">🎯 Final Recommendations - Top 10 Improvements</h2>
               
               <div className="space-y-3">
-                {results.recommendations?.slice(0, 10).map((rec, idx) => (
+                {results.comprehensive_analysis?.final_recommendations?.slice(0, 10).map((rec, idx) => (
                   <div key={idx} className="flex items-start space-x-3 p-3 bg-blue-50 rounded-lg">
                     <div className="bg-blue-600 text-white rounded-full w-6 h-6 flex items-center justify-center text-sm font-bold">
                       {idx + 1}